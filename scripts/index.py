@@ -7,7 +7,7 @@ import argparse
 from pathlib import Path
 
 from src.core.indexing.pipeline import IndexingPipeline
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import setup_logging
 
 
@@ -23,7 +23,7 @@ async def main():
     parser.add_argument(
         "--data-dir",
         type=Path,
-        default=Path(settings.indexing.data_dir),
+        default=Path(get_settings().indexing.data_dir),
         help="Data directory path"
     )
     
@@ -10,11 +10,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.routes import health
-from src.api.middleware.rate_limit import RateLimitMiddleware
+from src.api.middleware.rate_limit import RateLimitMiddleware, SlidingWindowRateLimiter
 from src.core.pipeline import TAiPipeline
 from src.graph.schema import ensure_schema
 from src.memory.worker import GraphSyncWorker
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -77,7 +77,7 @@ def create_app() -> FastAPI:
     )
 
     # CORS
-    cors_origins = getattr(settings.api, "cors_origins", ["http://localhost:3000"])
+    cors_origins = getattr(get_settings().api, "cors_origins", ["http://localhost:3000"])
     app.add_middleware(
         CORSMiddleware,
         allow_origins=cors_origins,
@@ -86,8 +86,12 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Rate limiting (after CORS so CORS headers applied first)
-    app.add_middleware(RateLimitMiddleware)
+    # Rate limiting (after CORS so CORS headers applied first). The limiter is
+    # kept on app.state so its buckets can be inspected or cleared.
+    app.state.rate_limiter = SlidingWindowRateLimiter(
+        getattr(get_settings().api, "rate_limit_requests_per_minute", 30)
+    )
+    app.add_middleware(RateLimitMiddleware, limiter=app.state.rate_limiter)
 
     # Routes
     app.include_router(health.router)
@@ -107,8 +111,8 @@ def main():
     """CLI entry point for uvicorn."""
     import uvicorn
 
-    host = getattr(settings.api, "host", "0.0.0.0")
-    port = getattr(settings.api, "port", 8000)
+    host = getattr(get_settings().api, "host", "0.0.0.0")
+    port = getattr(get_settings().api, "port", 8000)
     uvicorn.run(
         "src.api.app:app",
         host=host,
@@ -9,7 +9,7 @@ from typing import Callable, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -48,6 +48,10 @@ class SlidingWindowRateLimiter:
         oldest = min(self._requests[student_id])
         return max(1, int(self.window_seconds - (time.time() - oldest)))
 
+    def clear(self):
+        """Forget all recorded requests."""
+        self._requests.clear()
+
 
 def get_student_id(request: Request) -> Optional[str]:
     """Extract student ID from request for rate limiting."""
@@ -79,11 +83,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         app,
         requests_per_minute: Optional[int] = None,
         skip_paths: Optional[list[str]] = None,
+        limiter: Optional[SlidingWindowRateLimiter] = None,
     ):
         super().__init__(app)
-        self.limiter = SlidingWindowRateLimiter(
+        self.limiter = limiter or SlidingWindowRateLimiter(
             requests_per_minute
-            or getattr(settings.api, "rate_limit_requests_per_minute", 30)
+            or getattr(get_settings().api, "rate_limit_requests_per_minute", 30)
         )
         self.skip_paths = set(skip_paths or ["/health", "/docs", "/openapi.json", "/redoc"])
 
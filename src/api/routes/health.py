@@ -2,20 +2,26 @@
 Health check endpoint.
 """
 
-from fastapi import APIRouter, Depends
+import time
+
+from fastapi import APIRouter, Depends, Response
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, Optional
 
 from src.api.dependencies import get_memory_store, get_worker
 from src.graph.connection import get_connection
 from src.memory.store import SafeMemoryStore
 from src.memory.worker import GraphSyncWorker
+from src.shared.config import get_settings
 
 router = APIRouter(tags=["health"])
 
 # Track startup time for uptime
 _start_time: Optional[float] = None
 
+# Monotonic expiry of the last successful Neo4j probe; failures are never cached
+_cache: Dict[str, float] = {"expires_at": 0.0}
+
 
 def set_start_time(t: float):
     """Set application start time."""
@@ -23,6 +29,17 @@ def set_start_time(t: float):
     _start_time = t
 
 
+def clear_cache():
+    """Drop the cached Neo4j probe result."""
+    _cache["expires_at"] = 0.0
+
+
+def _uptime_seconds() -> float:
+    if _start_time:
+        return round(time.time() - _start_time, 2)
+    return 0.0
+
+
 class HealthResponse(BaseModel):
     """Health check response model."""
 
@@ -35,22 +52,35 @@ class HealthResponse(BaseModel):
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check(
+    response: Response,
     memory_store: SafeMemoryStore = Depends(get_memory_store),
     worker: Optional[GraphSyncWorker] = Depends(get_worker),
 ):
     """
     Service health check.
     Returns status, Neo4j connection, WAL backlog, circuit breaker state, uptime.
+
+    Only a successful Neo4j probe is cached, for HEALTH_CACHE_TTL seconds
+    (X-Cache: HIT|MISS); a failed probe is retried on the next call so recovery
+    is seen immediately. WAL backlog and circuit breaker state are always fresh.
     """
-    import time
+    ttl = getattr(get_settings().api, "health_cache_ttl", 30.0)
+    now = time.monotonic()
 
     # Neo4j connection status
-    connection = get_connection()
-    neo4j_connected = False
-    try:
-        neo4j_connected = await connection.health_check()
-    except Exception:
-        pass
+    if now < _cache["expires_at"]:
+        response.headers["X-Cache"] = "HIT"
+        neo4j_connected = True
+    else:
+        response.headers["X-Cache"] = "MISS"
+        connection = get_connection()
+        neo4j_connected = False
+        try:
+            neo4j_connected = await connection.health_check()
+        except Exception:
+            pass
+        if neo4j_connected and ttl > 0:
+            _cache["expires_at"] = now + ttl
 
     # WAL backlog (unsynced facts count)
     unsynced = memory_store.get_unsynced_facts(limit=10000)
@@ -61,15 +91,12 @@ async def health_check(
     if worker:
         circuit_breaker_state = worker.circuit_breaker.state
 
-    # Uptime
-    uptime_seconds = 0.0
-    if _start_time:
-        uptime_seconds = round(time.time() - _start_time, 2)
-
+    # Operational state: never let clients or proxies reuse it
+    response.headers["Cache-Control"] = "no-store"
     return HealthResponse(
         status="healthy" if neo4j_connected else "degraded",
         neo4j_connected=neo4j_connected,
         wal_backlog_depth=wal_backlog_depth,
         circuit_breaker_state=circuit_breaker_state,
-        uptime_seconds=uptime_seconds,
+        uptime_seconds=_uptime_seconds(),
     )
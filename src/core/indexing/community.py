@@ -10,7 +10,7 @@ import leidenalg
 
 from src.graph.connection import get_connection
 from src.shared.llm import LLMClient
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,8 +31,8 @@ class CommunityDetector:
     
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
-        self.resolution = self.config.get("resolution", settings.graph_resolution)
-        self.llm = LLMClient(model=settings.llm.extraction_model, temperature=0.0)
+        self.resolution = self.config.get("resolution", get_settings().graph_resolution)
+        self.llm = LLMClient(model=get_settings().llm.extraction_model, temperature=0.0)
     
     async def detect(self) -> List[Community]:
         """
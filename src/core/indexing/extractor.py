@@ -11,12 +11,47 @@ import yaml
 
 from src.core.indexing.ingestors.base import DocumentChunk
 from src.shared.llm import LLMClient
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.exceptions import ExtractionError
+from src.shared.json_utils import loads as _loads, dumps as _dumps
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Structured-output schema for entity/relationship extraction; a shared
+# constant so LLMClient reuses its rendered form by identity
+_EXTRACTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "entities": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "type": {"type": "string"},
+                    "description": {"type": "string"}
+                },
+                "required": ["name", "type", "description"]
+            }
+        },
+        "relationships": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "source": {"type": "string"},
+                    "target": {"type": "string"},
+                    "type": {"type": "string"},
+                    "description": {"type": "string"}
+                },
+                "required": ["source", "target", "type", "description"]
+            }
+        }
+    },
+    "required": ["entities", "relationships"]
+}
+
 
 @dataclass
 class Entity:
@@ -57,7 +92,7 @@ class EntityRelationshipExtractor:
         self.config = config or {}
         
         # Load schema
-        schema_path = settings.indexing.data_dir.parent / "config" / "schema.yaml"
+        schema_path = get_settings().indexing.data_dir.parent / "config" / "schema.yaml"
         if not schema_path.exists():
             schema_path = Path("config/schema.yaml")
         
@@ -76,7 +111,7 @@ class EntityRelationshipExtractor:
             self.base_prompt = self._default_prompt()
         
         # Initialize LLM client
-        model = self.config.get("model", settings.llm.extraction_model)
+        model = self.config.get("model", get_settings().llm.extraction_model)
         self.llm = LLMClient(model=model, temperature=0.0)
     
     def _default_prompt(self) -> str:
@@ -96,44 +131,11 @@ class EntityRelationshipExtractor:
         # Build prompt
         prompt = self.base_prompt.replace("{chunk_text}", chunk.text)
         
-        # Define JSON schema for structured output
-        schema = {
-            "type": "object",
-            "properties": {
-                "entities": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "type": {"type": "string"},
-                            "description": {"type": "string"}
-                        },
-                        "required": ["name", "type", "description"]
-                    }
-                },
-                "relationships": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "source": {"type": "string"},
-                            "target": {"type": "string"},
-                            "type": {"type": "string"},
-                            "description": {"type": "string"}
-                        },
-                        "required": ["source", "target", "type", "description"]
-                    }
-                }
-            },
-            "required": ["entities", "relationships"]
-        }
-        
         try:
             # Get structured completion
             response = await self.llm.get_structured_completion(
                 prompt=prompt,
-                schema=schema,
+                schema=_EXTRACTION_SCHEMA,
                 system_prompt="You are a distributed systems expert extracting structured knowledge."
             )
             
@@ -147,7 +149,7 @@ class EntityRelationshipExtractor:
             return ExtractionResult(
                 entities=entities,
                 relationships=relationships,
-                raw_response=json.dumps(response)
+                raw_response=_dumps(response)
             )
         
         except json.JSONDecodeError as e:
@@ -333,7 +335,7 @@ class EntityRelationshipExtractor:
         import re
         json_match = re.search(r'\{.*\}', text, re.DOTALL)
         if json_match:
-            return json.loads(json_match.group(0))
+            return _loads(json_match.group(0))
         
         raise json.JSONDecodeError("No JSON found in text", text, 0)
     
@@ -9,7 +9,7 @@ import fitz  # PyMuPDF
 import re
 
 from src.core.indexing.ingestors.base import BaseIngestor, DocumentChunk
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.tokens import count_tokens
 
 
@@ -18,8 +18,8 @@ class PaperIngestor(BaseIngestor):
     
     def __init__(self, config=None):
         super().__init__(config)
-        self.chunk_size = self.config.get("chunk_size", settings.indexing.chunk_size)
-        self.chunk_overlap = self.config.get("chunk_overlap", settings.indexing.chunk_overlap)
+        self.chunk_size = self.config.get("chunk_size", get_settings().indexing.chunk_size)
+        self.chunk_overlap = self.config.get("chunk_overlap", get_settings().indexing.chunk_overlap)
     
     def can_ingest(self, path: Path) -> bool:
         """Check if file is PDF."""
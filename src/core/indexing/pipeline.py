@@ -5,8 +5,9 @@ Coordinates: file discovery → ingestion → extraction → resolution → Neo4
 
 import asyncio
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 import hashlib
+import zlib
 
 from src.core.indexing.ingestors.base import BaseIngestor, DocumentChunk
 from src.core.indexing.ingestors.slides import SlidesIngestor
@@ -20,8 +21,8 @@ from src.core.indexing.extractor import EntityRelationshipExtractor
 from src.core.indexing.resolver import EntityResolver
 from src.graph.connection import get_connection
 from src.graph.queries import CourseQueries
-from src.graph.schema import RelationshipType
-from src.shared.config import settings
+from src.graph.schema import RelationshipType, ensure_schema
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -51,6 +52,11 @@ class IndexingPipeline:
         # Neo4j connection
         self.neo4j = get_connection()
         
+        # Rows per UNWIND statement when writing to Neo4j
+        self.write_batch_size = self.config.get("write_batch_size", 1000)
+        # Concurrent relationship writers (each with its own session)
+        self.write_workers = self.config.get("write_workers", 4)
+        
         # Statistics
         self.stats = {
             "files_processed": 0,
@@ -81,6 +87,10 @@ class IndexingPipeline:
         # Connect to Neo4j
         await self.neo4j.connect()
         
+        # Concept.id uniqueness constraint (and its index) must exist before
+        # the batched MERGEs, otherwise every MERGE scans the label
+        await ensure_schema()
+        
         # Clear graph if full mode
         if mode == "full":
             await self._clear_graph()
@@ -146,7 +156,7 @@ class IndexingPipeline:
         
         if mode == "staging":
             # Only process staging directory
-            staging_dir = Path(settings.indexing.staging_dir)
+            staging_dir = Path(get_settings().indexing.staging_dir)
             if staging_dir.exists():
                 files.extend(self._find_files(staging_dir))
         else:
@@ -204,68 +214,107 @@ class IndexingPipeline:
         resolved_entities: List,
         relationships: List
     ):
-        """Store resolved entities and relationships in Neo4j."""
-        async with self.neo4j.session() as session:
-            # Batch entities (50 per transaction)
-            batch_size = 50
-            
-            for i in range(0, len(resolved_entities), batch_size):
-                batch = resolved_entities[i:i + batch_size]
-                
-                async with session.begin_transaction() as tx:
-                    for resolved in batch:
-                        # Create concept node
-                        query_result = CourseQueries.upsert_concept(
-                            name=resolved.canonical_name,
-                            description=" | ".join(resolved.descriptions) if resolved.descriptions else "",
-                            concept_type=resolved.type
-                        )
-                        await tx.run(query_result.query, query_result.params)
-                    
-                    await tx.commit()
-            
-            # Store relationships
-            # Validate allowed relationship types to prevent Cypher injection
-            allowed_rel_types = {rt.value for rt in RelationshipType}
+        """Store resolved entities and relationships in Neo4j using batched UNWIND writes."""
+        batch_size = self.write_batch_size
+        
+        concepts = [
+            {
+                "name": resolved.canonical_name,
+                "description": " | ".join(resolved.descriptions) if resolved.descriptions else "",
+                "concept_type": resolved.type,
+            }
+            for resolved in resolved_entities
+        ]
+        
+        # Validate allowed relationship types to prevent Cypher injection
+        allowed_rel_types = {rt.value for rt in RelationshipType}
+        rel_rows = []
+        
+        for rel in relationships:
+            # SECURITY: validate rel.type against schema enum — never interpolate raw
+            rel_type_upper = rel.type.strip().upper()
+            if rel_type_upper not in allowed_rel_types:
+                logger.warning(f"Skipping unknown relationship type: {rel.type}")
+                continue
             
-            for rel in relationships:
-                # SECURITY: validate rel.type against schema enum — never interpolate raw
-                rel_type_upper = rel.type.strip().upper()
-                if rel_type_upper not in allowed_rel_types:
-                    logger.warning(f"Skipping unknown relationship type: {rel.type}")
-                    continue
-                
-                # Find source and target entity IDs
-                source_query = CourseQueries.find_concept_by_name(rel.source)
-                target_query = CourseQueries.find_concept_by_name(rel.target)
-                
-                async with session.begin_transaction() as tx:
-                    source_result = await tx.run(source_query.query, source_query.params)
-                    target_result = await tx.run(target_query.query, target_query.params)
-                    
-                    source_record = await source_result.single()
-                    target_record = await target_result.single()
-                    
-                    if source_record and target_record:
-                        # Use APOC to create relationship with dynamic type safely
-                        # APOC's apoc.merge.relationship uses parameterized type
-                        rel_query = """
-                        MATCH (source:Concept {id: $source_id})
-                        MATCH (target:Concept {id: $target_id})
-                        CALL apoc.merge.relationship(
-                            source, $rel_type, {description: $description, created_at: timestamp()},
-                            {}, target, {}
-                        ) YIELD rel
-                        RETURN rel
-                        """
-                        await tx.run(rel_query, {
-                            "source_id": source_record["id"],
-                            "target_id": target_record["id"],
-                            "rel_type": rel_type_upper,
-                            "description": rel.description
-                        })
-                    
-                    await tx.commit()
+            rel_rows.append({
+                "source": rel.source,
+                "target": rel.target,
+                "rel_type": rel_type_upper,
+                "description": rel.description,
+            })
+        
+        async with self.neo4j.session() as session:
+            for i in range(0, len(concepts), batch_size):
+                query_result = CourseQueries.upsert_concepts_batch(concepts[i:i + batch_size])
+                await session.execute_write(self._run_write, query_result)
+        
+        # Relationships go after all concepts so both endpoints can be matched
+        await self._write_relationships(rel_rows)
+    
+    async def _write_relationships(self, rel_rows: List[Dict[str, Any]]):
+        """
+        Write relationships from parallel workers without lock contention.
+        
+        Endpoint names are hashed into an odd number of bins, and each relationship
+        goes to the bucket for its (unordered) pair of endpoint bins. Buckets are
+        scheduled round-robin so the ones written concurrently never share a bin,
+        hence never lock the same node. Deadlocks that still occur are transient
+        errors, which execute_write retries with exponential backoff.
+        """
+        workers = max(1, self.write_workers)
+        n_bins = 2 * workers - 1
+        # Smaller batches per worker keep each transaction's lock set short
+        batch_size = max(1, self.write_batch_size // workers)
+        
+        buckets: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+        for row in rel_rows:
+            a = self._node_bin(row["source"], n_bins)
+            b = self._node_bin(row["target"], n_bins)
+            buckets.setdefault((min(a, b), max(a, b)), []).append(row)
+        
+        for pairs in self._bin_rounds(n_bins):
+            round_buckets = [buckets[pair] for pair in pairs if pair in buckets]
+            if round_buckets:
+                await asyncio.gather(*(
+                    self._write_relationship_bucket(bucket, batch_size)
+                    for bucket in round_buckets
+                ))
+    
+    async def _write_relationship_bucket(self, rows: List[Dict[str, Any]], batch_size: int):
+        """Write one bucket of relationships on a dedicated session."""
+        async with self.neo4j.session() as session:
+            for i in range(0, len(rows), batch_size):
+                query_result = CourseQueries.merge_relationships_batch(rows[i:i + batch_size])
+                await session.execute_write(self._run_write, query_result)
+    
+    @staticmethod
+    def _node_bin(name: str, n_bins: int) -> int:
+        """Stable bin for a concept name (matched case-insensitively in Neo4j)."""
+        return zlib.crc32(name.lower().encode()) % n_bins
+    
+    @staticmethod
+    def _bin_rounds(n_bins: int) -> List[List[Tuple[int, int]]]:
+        """
+        Round-robin schedule over all bin pairs, including (i, i), for odd n_bins.
+        
+        Round r holds (r, r) and every pair (r - k, r + k); the bins within a round
+        are all distinct, and each unordered pair appears in exactly one round.
+        """
+        rounds = []
+        for r in range(n_bins):
+            pairs = [(r, r)]
+            for k in range(1, n_bins // 2 + 1):
+                a, b = (r - k) % n_bins, (r + k) % n_bins
+                pairs.append((min(a, b), max(a, b)))
+            rounds.append(pairs)
+        return rounds
+    
+    @staticmethod
+    async def _run_write(tx, query_result):
+        """Run one batched write inside a managed transaction."""
+        result = await tx.run(query_result.query, query_result.params)
+        await result.consume()
     
     async def _clear_graph(self):
         """Clear existing graph (full mode only)."""
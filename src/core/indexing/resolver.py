@@ -3,14 +3,17 @@ Entity resolution and deduplication.
 Merges entities across chunks using exact match, embedding similarity, and LLM adjudication.
 """
 
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, FrozenSet, Tuple, Optional
 from dataclasses import dataclass
 import hashlib
+import sys
+
+import numpy as np
 
 from src.core.indexing.extractor import Entity
 from src.shared.embeddings import EmbeddingClient
 from src.shared.llm import LLMClient
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -22,8 +25,15 @@ class ResolvedEntity:
     canonical_name: str
     type: str
     descriptions: List[str]  # Merged descriptions
-    source_chunks: Set[str]  # All source chunk hashes
-    aliases: Set[str]  # Alternative names found
+    source_chunks: FrozenSet[str]  # All source chunk hashes
+    aliases: FrozenSet[str]  # Alternative names found
+    
+    def __post_init__(self):
+        # Types and chunk hashes repeat across many entities; interning makes
+        # their hash/eq checks pointer comparisons
+        self.type = sys.intern(self.type)
+        self.source_chunks = frozenset(sys.intern(h) for h in self.source_chunks)
+        self.aliases = frozenset(self.aliases)
 
 
 class EntityResolver:
@@ -32,7 +42,7 @@ class EntityResolver:
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.embedding_client = EmbeddingClient()
-        self.llm = LLMClient(model=settings.llm.extraction_model, temperature=0.0)
+        self.llm = LLMClient(model=get_settings().llm.extraction_model, temperature=0.0)
         self.similarity_threshold = self.config.get("similarity_threshold", 0.85)
     
     async def resolve(self, entities: List[Entity]) -> List[ResolvedEntity]:
@@ -85,7 +95,14 @@ class EntityResolver:
         canonical_names = [group[0].name for group in groups]
         embeddings = await self.embedding_client.embed(canonical_names)
         
-        # Build similarity matrix
+        # Build similarity matrix: with unit-length rows one matmul gives all
+        # pairwise cosine similarities. EmbeddingClient already normalizes;
+        # other clients are normalized here.
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if getattr(self.embedding_client, "embedding_normalized", False) is not True:
+            matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+        similar = (matrix @ matrix.T) >= self.similarity_threshold
+        
         merged_groups = []
         processed = set()
         
@@ -94,20 +111,14 @@ class EntityResolver:
                 continue
             
             current_group = group1.copy()
-            emb1 = embeddings[i]
             
-            # Check similarity with remaining groups
-            for j, group2 in enumerate(groups[i+1:], start=i+1):
+            # Merge remaining groups above the threshold
+            for j in np.flatnonzero(similar[i, i + 1:]) + i + 1:
+                j = int(j)
                 if j in processed:
                     continue
-                
-                emb2 = embeddings[j]
-                similarity = self.embedding_client.cosine_similarity(emb1, emb2)
-                
-                if similarity >= self.similarity_threshold:
-                    # Merge groups
-                    current_group.extend(group2)
-                    processed.add(j)
+                current_group.extend(groups[j])
+                processed.add(j)
             
             merged_groups.append(current_group)
             processed.add(i)
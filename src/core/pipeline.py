@@ -14,7 +14,6 @@ from src.memory.store import SafeMemoryStore
 from src.safety.consent import ConsentManager
 from src.session.manager import SessionManager
 from src.shared.llm import LLMClient
-from src.shared.config import settings
 from src.shared.exceptions import ConsentRequiredError
 from src.shared.logging import get_logger
 
@@ -109,8 +108,10 @@ class TAiPipeline:
         citations = [r.source for r in retrieval_results]
         
         # Add to session
-        self.session_manager.add_message(session["session_key"], "student", question)
-        self.session_manager.add_message(session["session_key"], "assistant", answer)
+        self.session_manager.add_messages(
+            session["session_key"],
+            [("student", question), ("assistant", answer)]
+        )
         
         # Check for misconceptions (simplified for now)
         misconception_detected = False  # Would call misconception detector
@@ -10,6 +10,7 @@ import sqlite3
 import json
 
 from src.core.profile.generator import ProfileGenerator
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -26,7 +27,7 @@ class ProfileCache:
         self.l1_ttl = self.config.get("l1_ttl", 300)  # 5 minutes
         
         # L2: SQLite cache
-        self.l2_db_path = Path(self.config.get("l2_db", "data/profile_cache.sqlite"))
+        self.l2_db_path = Path(self.config.get("l2_db", get_settings().profile_cache_path))
         self.l2_ttl = self.config.get("l2_ttl", 1800)  # 30 minutes
         self._init_l2_cache()
         
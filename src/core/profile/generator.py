@@ -7,7 +7,6 @@ from pathlib import Path
 
 from src.graph.connection import get_connection
 from src.graph.queries import ProfileQueries
-from src.shared.config import settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
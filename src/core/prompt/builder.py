@@ -7,7 +7,6 @@ from pathlib import Path
 
 from src.core.profile.cache import ProfileCache
 from src.shared.tokens import count_tokens, truncate_to_tokens
-from src.shared.config import settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 
 from src.core.retrieval.local_search import RetrievalResult
 from src.shared.tokens import count_tokens, truncate_to_tokens
-from src.shared.config import settings
+from src.shared.config import get_settings
 
 
 class ContextBuilder:
@@ -16,7 +16,7 @@ class ContextBuilder:
     
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
-        self.token_budget = self.config.get("token_budget", settings.retrieval.max_context_tokens)
+        self.token_budget = self.config.get("token_budget", get_settings().retrieval.max_context_tokens)
     
     def build(
         self,
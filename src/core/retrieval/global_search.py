@@ -8,7 +8,7 @@ from dataclasses import dataclass
 
 from src.graph.connection import get_connection
 from src.shared.llm import LLMClient
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -27,7 +27,7 @@ class GlobalSearch:
     
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
-        self.llm = LLMClient(model=settings.llm.reasoning_model, temperature=0.0)
+        self.llm = LLMClient(model=get_settings().llm.reasoning_model, temperature=0.0)
     
     async def search(self, query: str) -> GlobalSearchResult:
         """
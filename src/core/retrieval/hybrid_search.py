@@ -7,7 +7,7 @@ import asyncio
 
 from src.core.retrieval.local_search import LocalSearch, RetrievalResult
 from src.shared.embeddings import EmbeddingClient
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -20,8 +20,8 @@ class HybridSearch:
         self.config = config or {}
         self.local_search = LocalSearch()
         self.embedding_client = EmbeddingClient()
-        self.graph_weight = self.config.get("graph_weight", settings.retrieval.hybrid_graph_weight)
-        self.vector_weight = self.config.get("vector_weight", settings.retrieval.hybrid_vector_weight)
+        self.graph_weight = self.config.get("graph_weight", get_settings().retrieval.hybrid_graph_weight)
+        self.vector_weight = self.config.get("vector_weight", get_settings().retrieval.hybrid_vector_weight)
     
     async def search(self, query: str, top_k: int = 5) -> List[RetrievalResult]:
         """
@@ -9,7 +9,7 @@ from src.graph.connection import get_connection
 from src.graph.queries import CourseQueries
 from src.shared.embeddings import EmbeddingClient
 from src.shared.tokens import count_tokens, truncate_to_tokens
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -31,8 +31,8 @@ class LocalSearch:
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.embedding_client = EmbeddingClient()
-        self.top_k = self.config.get("top_k", settings.retrieval.top_k)
-        self.max_tokens = self.config.get("max_tokens", settings.retrieval.max_context_tokens)
+        self.top_k = self.config.get("top_k", get_settings().retrieval.top_k)
+        self.max_tokens = self.config.get("max_tokens", get_settings().retrieval.max_context_tokens)
     
     async def search(
         self,
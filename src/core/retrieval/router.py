@@ -11,11 +11,24 @@ from src.core.retrieval.global_search import GlobalSearch
 from src.core.retrieval.hybrid_search import HybridSearch
 
 from src.shared.llm import LLMClient
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Structured-output schema for query entity extraction; a shared constant so
+# LLMClient reuses its rendered form by identity
+_QUERY_ENTITIES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "entities": {
+            "type": "array",
+            "items": {"type": "string"}
+        }
+    },
+    "required": ["entities"]
+}
+
 
 class SearchStrategy(str, Enum):
     """Available search strategies."""
@@ -38,7 +51,7 @@ class QueryRouter:
     
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
-        self.llm = LLMClient(model=settings.llm.extraction_model, temperature=0.0)
+        self.llm = LLMClient(model=get_settings().llm.extraction_model, temperature=0.0)
     
     async def route(self, query: str) -> RoutingResult:
         """
@@ -129,18 +142,7 @@ Query: {query}
 Return a JSON array of entity names found in the query. If none found, return empty array []."""
         
         try:
-            schema = {
-                "type": "object",
-                "properties": {
-                    "entities": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    }
-                },
-                "required": ["entities"]
-            }
-            
-            response = await self.llm.get_structured_completion(prompt, schema)
+            response = await self.llm.get_structured_completion(prompt, _QUERY_ENTITIES_SCHEMA)
             return response.get("entities", [])
         
         except Exception as e:
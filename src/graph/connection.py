@@ -8,7 +8,7 @@ from contextlib import asynccontextmanager
 from neo4j import GraphDatabase, AsyncGraphDatabase
 from neo4j.exceptions import ServiceUnavailable, TransientError
 
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.exceptions import GraphConnectionError
 from src.shared.logging import get_logger
 
@@ -24,9 +24,9 @@ class Neo4jConnection:
         user: Optional[str] = None,
         password: Optional[str] = None
     ):
-        self.uri = uri or settings.neo4j.uri
-        self.user = user or settings.neo4j.user
-        self.password = password or settings.neo4j.password
+        self.uri = uri or get_settings().neo4j.uri
+        self.user = user or get_settings().neo4j.user
+        self.password = password or get_settings().neo4j.password
         
         self._driver: Optional[AsyncGraphDatabase] = None
         self._sync_driver: Optional[GraphDatabase] = None
@@ -38,8 +38,8 @@ class Neo4jConnection:
                 self._driver = AsyncGraphDatabase.driver(
                     self.uri,
                     auth=(self.user, self.password),
-                    max_connection_lifetime=settings.neo4j.max_connection_lifetime,
-                    max_connection_pool_size=settings.neo4j.max_connection_pool_size
+                    max_connection_lifetime=get_settings().neo4j.max_connection_lifetime,
+                    max_connection_pool_size=get_settings().neo4j.max_connection_pool_size
                 )
                 # Verify connectivity
                 await self._driver.verify_connectivity()
@@ -54,8 +54,8 @@ class Neo4jConnection:
                 self._sync_driver = GraphDatabase.driver(
                     self.uri,
                     auth=(self.user, self.password),
-                    max_connection_lifetime=settings.neo4j.max_connection_lifetime,
-                    max_connection_pool_size=settings.neo4j.max_connection_pool_size
+                    max_connection_lifetime=get_settings().neo4j.max_connection_lifetime,
+                    max_connection_pool_size=get_settings().neo4j.max_connection_pool_size
                 )
                 # Verify connectivity
                 self._sync_driver.verify_connectivity()
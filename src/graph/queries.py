@@ -5,6 +5,7 @@ ALL queries use parameterized syntax ($param) - NEVER string interpolation.
 
 from typing import Dict, Any, Tuple, List, Optional
 from dataclasses import dataclass
+import hashlib
 
 from src.graph.schema import NodeType, RelationshipType
 
@@ -16,6 +17,11 @@ class QueryResult:
     params: Dict[str, Any]
 
 
+def _concept_id(name: str) -> str:
+    """Deterministic concept ID derived from the (case-folded) name."""
+    return hashlib.sha256(name.lower().encode()).hexdigest()[:16]
+
+
 class CourseQueries:
     """Queries for course content (concepts, algorithms, protocols)."""
     
@@ -44,8 +50,7 @@ class CourseQueries:
         query += "\nRETURN c.id as id, c.name as name"
         
         # Generate deterministic ID from name
-        import hashlib
-        concept_id = hashlib.sha256(name.lower().encode()).hexdigest()[:16]
+        concept_id = _concept_id(name)
         
         params = {
             "concept_id": concept_id,
@@ -57,6 +62,71 @@ class CourseQueries:
         
         return QueryResult(query=query, params=params)
     
+    @staticmethod
+    def upsert_concepts_batch(concepts: List[Dict[str, Any]]) -> QueryResult:
+        """
+        Upsert many concept nodes in one round-trip.
+        
+        Args:
+            concepts: Dicts with "name", "description" and optional "concept_type"
+        
+        Returns:
+            QueryResult with a single UNWIND query over $rows
+        """
+        query = """
+        UNWIND $rows AS row
+        MERGE (c:Concept {id: row.concept_id})
+        SET c.name = row.name,
+            c.description = row.description,
+            c.type = coalesce(row.concept_type, c.type),
+            c.updated_at = timestamp()
+        RETURN count(c) as upserted
+        """
+        rows = [
+            {
+                "concept_id": _concept_id(concept["name"]),
+                "name": concept["name"],
+                "description": concept.get("description", ""),
+                "concept_type": concept.get("concept_type") or None,
+            }
+            for concept in concepts
+        ]
+        return QueryResult(query=query, params={"rows": rows})
+    
+    @staticmethod
+    def merge_relationships_batch(relationships: List[Dict[str, Any]]) -> QueryResult:
+        """
+        Merge many concept-to-concept relationships in one round-trip.
+        
+        Endpoints are matched by the name-derived concept id, which the
+        uniqueness constraint indexes; rows whose endpoints are missing are
+        skipped. Relationship types must already be validated against RelationshipType —
+        they are passed as a parameter to APOC, never interpolated.
+        
+        Args:
+            relationships: Dicts with "source", "target", "rel_type", "description"
+        """
+        query = """
+        UNWIND $rows AS row
+        MATCH (source:Concept {id: row.source_id})
+        MATCH (target:Concept {id: row.target_id})
+        CALL apoc.merge.relationship(
+            source, row.rel_type, {description: row.description, created_at: timestamp()},
+            {}, target, {}
+        ) YIELD rel
+        RETURN count(rel) as merged
+        """
+        rows = [
+            {
+                "source_id": _concept_id(rel["source"]),
+                "target_id": _concept_id(rel["target"]),
+                "rel_type": rel["rel_type"],
+                "description": rel.get("description", ""),
+            }
+            for rel in relationships
+        ]
+        return QueryResult(query=query, params={"rows": rows})
+    
     @staticmethod
     def create_prerequisite_relationship(
         prerequisite_id: str,
@@ -9,12 +9,36 @@ import json
 from src.memory.store import SafeMemoryStore
 from src.memory.models import LearningEvent
 from src.shared.llm import LLMClient
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.tokens import count_tokens
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Structured-output schema for learning-event extraction; a shared constant
+# so LLMClient reuses its rendered form by identity
+_LEARNING_EVENTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "learning_events": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "concept_name": {"type": "string"},
+                    "event_type": {"type": "string"},
+                    "confidence": {"type": "number"},
+                    "evidence_type": {"type": "string"},
+                    "context_scope": {"type": "string"},
+                    "evidence": {"type": "object"}
+                },
+                "required": ["concept_name", "event_type", "confidence", "evidence_type", "context_scope"]
+            }
+        }
+    },
+    "required": ["learning_events"]
+}
+
 
 class MemoryFlushEngine:
     """Extracts learning events before conversation compaction."""
@@ -23,7 +47,7 @@ class MemoryFlushEngine:
         self.memory_store = memory_store
         self.config = config or {}
         self.flush_threshold = self.config.get("flush_threshold", 16000)  # tokens
-        self.llm = LLMClient(model=settings.llm.extraction_model, temperature=0.0)
+        self.llm = LLMClient(model=get_settings().llm.extraction_model, temperature=0.0)
         
         # Load flush prompt
         prompt_path = Path("config/prompts/flush.md")
@@ -74,34 +98,11 @@ class MemoryFlushEngine:
         # Build prompt
         prompt = self.flush_prompt_template.replace("{conversation_text}", conversation_text)
         
-        # Define JSON schema
-        schema = {
-            "type": "object",
-            "properties": {
-                "learning_events": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "concept_name": {"type": "string"},
-                            "event_type": {"type": "string"},
-                            "confidence": {"type": "number"},
-                            "evidence_type": {"type": "string"},
-                            "context_scope": {"type": "string"},
-                            "evidence": {"type": "object"}
-                        },
-                        "required": ["concept_name", "event_type", "confidence", "evidence_type", "context_scope"]
-                    }
-                }
-            },
-            "required": ["learning_events"]
-        }
-        
         try:
             # Get structured extraction
             response = await self.llm.get_structured_completion(
                 prompt=prompt,
-                schema=schema,
+                schema=_LEARNING_EVENTS_SCHEMA,
                 system_prompt="You are extracting learning events from a teaching conversation."
             )
             
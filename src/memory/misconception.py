@@ -10,11 +10,26 @@ from src.graph.connection import get_connection
 from src.graph.queries import MisconceptionQueries, CourseQueries
 from src.memory.store import SafeMemoryStore
 from src.shared.llm import LLMClient
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Structured-output schema for misconception classification; a shared
+# constant so LLMClient reuses its rendered form by identity
+_CLASSIFICATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "holds_known_misconception": {"type": "boolean"},
+        "matched_misconception": {"type": ["string", "null"]},
+        "is_identifying_not_holding": {"type": "boolean"},
+        "is_new_candidate": {"type": "boolean"},
+        "new_candidate_description": {"type": ["string", "null"]},
+        "contradicts_concept": {"type": ["string", "null"]}
+    },
+    "required": ["holds_known_misconception", "is_identifying_not_holding", "is_new_candidate"]
+}
+
 
 class MisconceptionDetector:
     """Detect misconceptions using graph-based LLM classification."""
@@ -22,7 +37,7 @@ class MisconceptionDetector:
     def __init__(self, memory_store: SafeMemoryStore, config: Optional[Dict] = None):
         self.memory_store = memory_store
         self.config = config or {}
-        self.llm = LLMClient(model=settings.llm.extraction_model, temperature=0.0)
+        self.llm = LLMClient(model=get_settings().llm.extraction_model, temperature=0.0)
         self.confirmation_threshold = self.config.get("confirmation_threshold", 3)
         
         # Load classification prompt
@@ -59,23 +74,9 @@ class MisconceptionDetector:
             "{known_misconceptions}", json.dumps(known_misconceptions, indent=2)
         )
         
-        # Define JSON schema
-        schema = {
-            "type": "object",
-            "properties": {
-                "holds_known_misconception": {"type": "boolean"},
-                "matched_misconception": {"type": ["string", "null"]},
-                "is_identifying_not_holding": {"type": "boolean"},
-                "is_new_candidate": {"type": "boolean"},
-                "new_candidate_description": {"type": ["string", "null"]},
-                "contradicts_concept": {"type": ["string", "null"]}
-            },
-            "required": ["holds_known_misconception", "is_identifying_not_holding", "is_new_candidate"]
-        }
-        
         try:
             # Classify
-            result = await self.llm.get_structured_completion(prompt, schema)
+            result = await self.llm.get_structured_completion(prompt, _CLASSIFICATION_SCHEMA)
             
             # If new candidate and student is HOLDING (not identifying), write to WAL
             if result.get("is_new_candidate") and not result.get("is_identifying_not_holding"):
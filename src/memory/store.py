@@ -5,25 +5,107 @@ SafeMemoryStore: SQLite + WAL mode for FERPA-compliant student data storage.
 import sqlite3
 import json
 import hashlib
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from contextlib import contextmanager
 
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.exceptions import ConsentRequiredError, FERPAComplianceError
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Dedup-only hashing, so the faster BLAKE3 is used for new rows when
+# installed. Stored hashes carry an "<algorithm>:" prefix and are never
+# converted; dedup checks them with the algorithm they name.
+def _sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+_DIGESTS: Dict[str, Callable[[bytes], str]] = {"sha256": _sha256_hex}
+
+try:
+    from blake3 import blake3 as _blake3
+
+    def _blake3_hex(data: bytes) -> str:
+        return _blake3(data).hexdigest()
+
+    _DIGESTS["blake3"] = _blake3_hex
+    _HASH_ALGORITHM = "blake3"
+except ImportError:
+    _HASH_ALGORITHM = "sha256"
+
+# PRAGMA user_version once legacy bare-hex hashes have been prefixed
+_SCHEMA_VERSION = 1
+
+
+def _content_hash(data: bytes, algorithm: str = _HASH_ALGORITHM) -> str:
+    """Algorithm-prefixed content hash, e.g. "sha256:9f86d0..."."""
+    return f"{algorithm}:{_DIGESTS[algorithm](data)}"
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS students (
+        id TEXT PRIMARY KEY,
+        anonymized_id TEXT NOT NULL UNIQUE,
+        consent_granted BOOLEAN DEFAULT 0,
+        consent_timestamp TEXT,
+        consent_text TEXT,
+        consent_session_token TEXT,
+        data_retention_days INTEGER DEFAULT 365,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    CREATE TABLE IF NOT EXISTS memories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id TEXT NOT NULL,
+        content TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        version INTEGER DEFAULT 1,
+        extracted_events_json TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (student_id) REFERENCES students(id)
+    );
+    
+    CREATE TABLE IF NOT EXISTS student_facts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id TEXT NOT NULL,
+        fact_text TEXT NOT NULL,
+        fact_type TEXT NOT NULL,
+        confidence_score REAL,
+        graph_synced BOOLEAN DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (student_id) REFERENCES students(id)
+    );
+    
+    CREATE TABLE IF NOT EXISTS wal_checkpoint (
+        id INTEGER PRIMARY KEY,
+        last_processed_id INTEGER,
+        checkpoint_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    CREATE INDEX IF NOT EXISTS idx_memories_student ON memories(student_id);
+    CREATE INDEX IF NOT EXISTS idx_memories_hash ON memories(content_hash);
+    CREATE INDEX IF NOT EXISTS idx_facts_student ON student_facts(student_id);
+    CREATE INDEX IF NOT EXISTS idx_facts_synced ON student_facts(graph_synced);
+"""
+
 
 class SafeMemoryStore:
     """FERPA-compliant memory store with WAL mode and crash recovery."""
     
     def __init__(self, db_path: Optional[Path] = None):
-        self.db_path = db_path or Path(settings.wal_path)
+        self.db_path = db_path or Path(get_settings().wal_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Granted consent by student_id -> monotonic expiry. Only grants are
+        # cached, so a grant written elsewhere is picked up on the next check;
+        # a revocation written elsewhere is seen once the entry expires.
+        self._consent_cache: Dict[str, float] = {}
+        self._consent_cache_ttl = get_settings().safety.consent_cache_ttl
+        
         # Initialize database
         self._init_database()
         
@@ -37,54 +119,40 @@ class SafeMemoryStore:
             conn.execute("PRAGMA journal_mode=WAL")
             
             # Create tables
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS students (
-                    id TEXT PRIMARY KEY,
-                    anonymized_id TEXT NOT NULL UNIQUE,
-                    consent_granted BOOLEAN DEFAULT 0,
-                    consent_timestamp TEXT,
-                    consent_text TEXT,
-                    consent_session_token TEXT,
-                    data_retention_days INTEGER DEFAULT 365,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-                
-                CREATE TABLE IF NOT EXISTS memories (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    content_hash TEXT NOT NULL,
-                    version INTEGER DEFAULT 1,
-                    extracted_events_json TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (student_id) REFERENCES students(id)
-                );
-                
-                CREATE TABLE IF NOT EXISTS student_facts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id TEXT NOT NULL,
-                    fact_text TEXT NOT NULL,
-                    fact_type TEXT NOT NULL,
-                    confidence_score REAL,
-                    graph_synced BOOLEAN DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (student_id) REFERENCES students(id)
-                );
-                
-                CREATE TABLE IF NOT EXISTS wal_checkpoint (
-                    id INTEGER PRIMARY KEY,
-                    last_processed_id INTEGER,
-                    checkpoint_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-                
-                CREATE INDEX IF NOT EXISTS idx_memories_student ON memories(student_id);
-                CREATE INDEX IF NOT EXISTS idx_memories_hash ON memories(content_hash);
-                CREATE INDEX IF NOT EXISTS idx_facts_student ON student_facts(student_id);
-                CREATE INDEX IF NOT EXISTS idx_facts_synced ON student_facts(graph_synced);
-            """)
+            conn.executescript(_SCHEMA)
+        
+        self._migrate_content_hashes()
+        self._dedup_algorithms = self._stored_hash_algorithms()
+    
+    def _migrate_content_hashes(self):
+        """Prefix legacy bare-hex hashes once; they were all SHA-256."""
+        with self._get_connection() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                return
             
-            conn.commit()
+            migrated = conn.execute(
+                "UPDATE memories SET content_hash = 'sha256:' || content_hash "
+                "WHERE instr(content_hash, ':') = 0"
+            ).rowcount
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            if migrated:
+                logger.info(f"Prefixed {migrated} legacy memory hashes with sha256")
+    
+    def _stored_hash_algorithms(self) -> List[str]:
+        """Hash algorithms to try when deduplicating, current one first."""
+        algorithms = [_HASH_ALGORITHM]
+        with self._get_connection() as conn:
+            for algorithm in _DIGESTS:
+                if algorithm == _HASH_ALGORITHM:
+                    continue
+                # Index range probe for any row hashed with this algorithm
+                # (";" sorts right after ":")
+                if conn.execute(
+                    "SELECT 1 FROM memories WHERE content_hash >= ? AND content_hash < ? LIMIT 1",
+                    (f"{algorithm}:", f"{algorithm};")
+                ).fetchone():
+                    algorithms.append(algorithm)
+        return algorithms
     
     @contextmanager
     def _get_connection(self):
@@ -102,13 +170,31 @@ class SafeMemoryStore:
     
     def require_consent(self, student_id: str) -> bool:
         """Check if student has granted consent."""
+        now = time.monotonic()
+        if self._consent_cache.get(student_id, 0.0) > now:
+            return True
+        
         with self._get_connection() as conn:
             result = conn.execute(
                 "SELECT consent_granted FROM students WHERE id = ?",
                 (student_id,)
             ).fetchone()
-            
-            return result and result["consent_granted"] == 1
+        
+        granted = bool(result and result["consent_granted"] == 1)
+        if granted:
+            self._consent_cache[student_id] = now + self._consent_cache_ttl
+        else:
+            self._consent_cache.pop(student_id, None)
+        return granted
+    
+    def revoke_consent(self, student_id: str):
+        """Withdraw consent; later writes raise ConsentRequiredError."""
+        with self._get_connection() as conn:
+            conn.execute(
+                "UPDATE students SET consent_granted = 0 WHERE id = ?",
+                (student_id,)
+            )
+        self._consent_cache.pop(student_id, None)
     
     def write_memory(
         self,
@@ -125,14 +211,16 @@ class SafeMemoryStore:
         if not self.require_consent(student_id):
             raise ConsentRequiredError(f"Student {student_id} has not granted consent")
         
-        # Generate content hash
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        # Generate content hash, plus one per other algorithm found in the store
+        data = content.encode()
+        hashes = [_content_hash(data, algorithm) for algorithm in self._dedup_algorithms]
+        content_hash = hashes[0]
         
         with self._get_connection() as conn:
             # Check for duplicate
             existing = conn.execute(
-                "SELECT id FROM memories WHERE content_hash = ?",
-                (content_hash,)
+                f"SELECT id FROM memories WHERE content_hash IN ({', '.join('?' * len(hashes))})",
+                hashes
             ).fetchone()
             
             if existing:
@@ -5,14 +5,14 @@ Async WAL → Neo4j graph worker with circuit breaker.
 import asyncio
 import json
 import hashlib
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime
 import time
 
 from src.memory.store import SafeMemoryStore
 from src.graph.connection import get_connection
 from src.graph.queries import StudentQueries, MisconceptionQueries
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.exceptions import CircuitBreakerOpenError, GraphConnectionError
 from src.shared.logging import get_logger
 
@@ -22,9 +22,15 @@ logger = get_logger(__name__)
 class CircuitBreaker:
     """Circuit breaker for Neo4j operations."""
     
-    def __init__(self, failure_threshold: int = 3, reset_seconds: int = 60):
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_seconds: int = 60,
+        time_fn: Callable[[], float] = time.monotonic
+    ):
         self.failure_threshold = failure_threshold
         self.reset_seconds = reset_seconds
+        self._time_fn = time_fn
         self.failure_count = 0
         self.last_failure_time = None
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
@@ -37,7 +43,7 @@ class CircuitBreaker:
     def record_failure(self):
         """Record failed operation."""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = self._time_fn()
         
         if self.failure_count >= self.failure_threshold:
             self.state = "OPEN"
@@ -50,8 +56,8 @@ class CircuitBreaker:
         
         if self.state == "OPEN":
             # Check if reset time has passed
-            if self.last_failure_time:
-                elapsed = time.time() - self.last_failure_time
+            if self.last_failure_time is not None:
+                elapsed = self._time_fn() - self.last_failure_time
                 if elapsed >= self.reset_seconds:
                     self.state = "HALF_OPEN"
                     return True
@@ -79,8 +85,8 @@ class GraphSyncWorker:
         self.batch_size = self.config.get("batch_size", 100)
         
         self.circuit_breaker = CircuitBreaker(
-            failure_threshold=settings.circuit_breaker_failure_threshold,
-            reset_seconds=settings.circuit_breaker_reset_seconds
+            failure_threshold=get_settings().circuit_breaker_failure_threshold,
+            reset_seconds=get_settings().circuit_breaker_reset_seconds
         )
         
         self.processed_ids = set()  # Track processed fact IDs for idempotency
@@ -39,6 +39,9 @@ class SecureExecutor:
         r'\.\./',          # Path traversal
     ]
     
+    # Compiled once at class creation; validate_command runs on every request
+    _DENYLIST_RES = [re.compile(p, re.IGNORECASE) for p in DENYLIST_PATTERNS]
+    
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.access_tier = self.config.get("access_tier", "read_only")
@@ -74,11 +77,11 @@ class SecureExecutor:
             }
         
         # Check denylist patterns
-        for pattern in self.DENYLIST_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
+        for pattern in self._DENYLIST_RES:
+            if pattern.search(command):
                 return {
                     "valid": False,
-                    "error": f"Command matches blocked pattern: {pattern}"
+                    "error": f"Command matches blocked pattern: {pattern.pattern}"
                 }
         
         # Check path traversal in all tokens
@@ -2,6 +2,7 @@
 Intervention protocol: triggers for professor notification.
 """
 
+import re
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -73,6 +74,12 @@ class InterventionProtocol:
                 "severity": InterventionSeverity.LOW
             }
         }
+        
+        # All safety keywords as one alternation: a single scan of the message
+        # instead of one substring search per keyword
+        self._safety_pattern = re.compile(
+            "|".join(re.escape(kw) for kw in self.triggers["safety_concern"]["keywords"])
+        )
     
     def check(self, context: Dict[str, Any]) -> List[Intervention]:
         """
@@ -133,13 +140,7 @@ class InterventionProtocol:
         """Check for safety or integrity concerns."""
         last_message = context.get("last_message", "").lower()
         
-        keywords = self.triggers["safety_concern"]["keywords"]
-        
-        for keyword in keywords:
-            if keyword in last_message:
-                return True
-        
-        return False
+        return self._safety_pattern.search(last_message) is not None
     
     def _check_assessment_discrepancy(self, context: Dict) -> bool:
         """Check for low-confidence automated assessment."""
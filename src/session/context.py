@@ -6,7 +6,6 @@ Manages token budget allocation across system prompt, retrieval, and history.
 from typing import List, Dict, Any, Optional
 
 from src.shared.tokens import count_tokens, truncate_to_tokens
-from src.shared.config import settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
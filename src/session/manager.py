@@ -4,11 +4,12 @@ Session manager with per-student, per-context isolation.
 
 import sqlite3
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
+from contextlib import contextmanager
 
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -18,32 +19,38 @@ class SessionManager:
     """Manages isolated sessions per student and context."""
     
     def __init__(self, db_path: Optional[Path] = None):
-        self.db_path = db_path or Path("data/sessions.sqlite")
+        self.db_path = db_path or Path(get_settings().session.db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
     
     def _init_database(self):
         """Initialize session database."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS sessions (
-                session_key TEXT PRIMARY KEY,
-                student_id TEXT NOT NULL,
-                course TEXT,
-                context TEXT,
-                messages TEXT,  -- JSON array
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        conn.commit()
-        conn.close()
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_key TEXT PRIMARY KEY,
+                    student_id TEXT NOT NULL,
+                    course TEXT,
+                    context TEXT,
+                    messages TEXT,  -- JSON array
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a connection with row_factory set."""
+    @contextmanager
+    def _get_connection(self):
+        """Get a connection with row_factory set; commits on success."""
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
-        return conn
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
     
     def generate_session_key(
         self,
@@ -65,9 +72,7 @@ class SessionManager:
         
         session_key = self.generate_session_key(student_id, course, context_name)
         
-        conn = self._get_connection()
-        
-        try:
+        with self._get_connection() as conn:
             # Check if session exists and is not expired
             cursor = conn.execute(
                 "SELECT * FROM sessions WHERE session_key = ?",
@@ -83,7 +88,6 @@ class SessionManager:
                 if datetime.now() - last_activity > timedelta(minutes=timeout_minutes):
                     # Session expired, create new
                     conn.execute("DELETE FROM sessions WHERE session_key = ?", (session_key,))
-                    conn.commit()
                 else:
                     # Return existing session
                     session = dict(row)
@@ -113,17 +117,16 @@ class SessionManager:
                     session["last_activity"]
                 )
             )
-            conn.commit()
             
             return session
-        finally:
-            conn.close()
     
     def add_message(self, session_key: str, role: str, content: str):
         """Add message to session."""
-        conn = self._get_connection()
-        
-        try:
+        self.add_messages(session_key, [(role, content)])
+    
+    def add_messages(self, session_key: str, messages: List[Tuple[str, str]]):
+        """Append (role, content) messages in order in a single transaction."""
+        with self._get_connection() as conn:
             cursor = conn.execute(
                 "SELECT messages FROM sessions WHERE session_key = ?",
                 (session_key,)
@@ -131,28 +134,23 @@ class SessionManager:
             row = cursor.fetchone()
             
             if row:
-                messages = json.loads(row["messages"])
-                messages.append({
-                    "role": role,
-                    "content": content,
-                    "timestamp": datetime.now().isoformat()
-                })
+                stored = json.loads(row["messages"])
+                now = datetime.now().isoformat()
+                stored.extend(
+                    {"role": role, "content": content, "timestamp": now}
+                    for role, content in messages
+                )
                 
                 conn.execute(
                     """UPDATE sessions
                        SET messages = ?, last_activity = ?
                        WHERE session_key = ?""",
-                    (json.dumps(messages), datetime.now().isoformat(), session_key)
+                    (json.dumps(stored), now, session_key)
                 )
-                conn.commit()
-        finally:
-            conn.close()
     
     def get_messages(self, session_key: str, limit: Optional[int] = None) -> List[Dict]:
         """Get recent messages from session."""
-        conn = self._get_connection()
-        
-        try:
+        with self._get_connection() as conn:
             cursor = conn.execute(
                 "SELECT messages FROM sessions WHERE session_key = ?",
                 (session_key,)
@@ -166,10 +164,8 @@ class SessionManager:
                 return messages
             
             return []
-        finally:
-            conn.close()
     
     def _get_timeout_minutes(self, context: str) -> int:
         """Get idle timeout for context type."""
-        reset_config = settings.session.reset_by_type.get(context, {})
-        return reset_config.get("idle_minutes", settings.session.idle_timeout_minutes)
+        reset_config = get_settings().session.reset_by_type.get(context, {})
+        return reset_config.get("idle_minutes", get_settings().session.idle_timeout_minutes)
@@ -7,9 +7,12 @@ import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 import yaml
+from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Neo4jConfig(BaseSettings):
     """Neo4j connection configuration."""
@@ -73,6 +76,7 @@ class SessionConfig(BaseSettings):
     """Session management configuration."""
     idle_timeout_minutes: int = Field(default=120, alias="SESSION_IDLE_TIMEOUT_MINUTES")
     max_tokens: int = Field(default=20000, alias="SESSION_MAX_TOKENS")
+    db_path: Path = Field(default=Path("data/sessions.sqlite"), alias="SESSION_DB_PATH")
     reset_by_type: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
 
     model_config = SettingsConfigDict(env_prefix="SESSION_", extra="ignore")
@@ -84,6 +88,7 @@ class ApiConfig(BaseSettings):
     port: int = Field(default=8000, alias="API_PORT")
     cors_origins: list[str] = Field(default_factory=lambda: ["http://localhost:3000"])
     rate_limit_requests_per_minute: int = Field(default=30, alias="API_RATE_LIMIT_RPM")
+    health_cache_ttl: float = Field(default=30.0, alias="HEALTH_CACHE_TTL")
 
     model_config = SettingsConfigDict(env_prefix="API_", extra="ignore")
 
@@ -93,6 +98,9 @@ class SafetyConfig(BaseSettings):
     ferpa_compliance_mode: str = Field(default="strict", alias="FERPA_COMPLIANCE_MODE")
     consent_required: bool = Field(default=True, alias="CONSENT_REQUIRED")
     data_retention_days: int = Field(default=365, alias="DATA_RETENTION_DAYS")
+    # Seconds a granted consent is trusted before re-reading the database, so a
+    # revocation from another process takes effect within this window
+    consent_cache_ttl: float = Field(default=5.0, alias="CONSENT_CACHE_TTL")
     executor_enabled: bool = Field(default=True)
     executor_allowlist: list[str] = Field(default_factory=lambda: [
         "go", "python3", "docker", "aws", "terraform", "locust"
@@ -104,6 +112,20 @@ class SafetyConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="SAFETY_", extra="ignore")
 
 
+def _flatten_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten compound YAML keys into the field names the settings models expect.
+    
+    Mutates ``cfg`` in place (it is a throwaway dict parsed from YAML).
+    """
+    api = cfg.get("api")
+    if isinstance(api, dict) and "rate_limit" in api:
+        rate_limit = api.pop("rate_limit")
+        if isinstance(rate_limit, dict) and "requests_per_minute" in rate_limit:
+            api["rate_limit_requests_per_minute"] = rate_limit["requests_per_minute"]
+    return cfg
+
+
 class TAiSettings(BaseSettings):
     """Main TAi configuration."""
     env: str = Field(default="dev", alias="TAI_ENV")
@@ -122,6 +144,10 @@ class TAiSettings(BaseSettings):
     
     # WAL and Graph sync
     wal_path: Path = Field(default=Path("data/wal.sqlite"), alias="WAL_PATH")
+    profile_cache_path: Path = Field(
+        default=Path("data/profile_cache.sqlite"),
+        alias="PROFILE_CACHE_PATH"
+    )
     graph_checkpoint_path: Path = Field(
         default=Path("data/graph_checkpoint.json"),
         alias="GRAPH_CHECKPOINT_PATH"
@@ -139,8 +165,6 @@ class TAiSettings(BaseSettings):
     graph_resolution: float = Field(default=0.05, alias="GRAPH_RESOLUTION")
 
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         case_sensitive=False,
         extra="allow"
     )
@@ -154,22 +178,12 @@ class TAiSettings(BaseSettings):
         config_dict: Dict[str, Any] = {}
         
         if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                yaml_data = yaml.safe_load(f) or {}
+            with config_path.open("r", encoding="utf-8") as f:
+                yaml_data = yaml.load(f, Loader=_YamlLoader) or {}
                 config_dict = yaml_data.get("tai", {})
         
-        # Flatten api.rate_limit.requests_per_minute if present
-        if "api" in config_dict and isinstance(config_dict["api"], dict):
-            api_cfg = dict(config_dict["api"])
-            rate_limit = api_cfg.get("rate_limit")
-            if isinstance(rate_limit, dict) and "requests_per_minute" in rate_limit:
-                api_cfg["rate_limit_requests_per_minute"] = rate_limit["requests_per_minute"]
-            if "rate_limit" in api_cfg:
-                del api_cfg["rate_limit"]
-            config_dict["api"] = api_cfg
-        
         # Create settings instance
-        settings = cls(**config_dict)
+        settings = cls(**_flatten_config(config_dict))
         
         # Override with environment variables
         return settings
@@ -183,9 +197,8 @@ def get_settings() -> TAiSettings:
     """Get or create global settings instance."""
     global _settings
     if _settings is None:
+        # Read .env into os.environ once, here rather than at import, so every
+        # sub-config sees it; real environment variables still take precedence
+        load_dotenv(".env", encoding="utf-8", override=False)
         _settings = TAiSettings.load_from_yaml()
     return _settings
-
-
-# Alias for convenience
-settings = get_settings()
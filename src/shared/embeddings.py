@@ -5,11 +5,10 @@ Supports OpenAI and local models with batch processing.
 
 from typing import List, Optional, Union
 import numpy as np
-from openai import AsyncOpenAI
-from sentence_transformers import SentenceTransformer
 
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.exceptions import TAiError
+from src.shared.llm import LLMProvider, _get_provider_client
 
 
 class EmbeddingError(TAiError):
@@ -17,8 +16,26 @@ class EmbeddingError(TAiError):
     pass
 
 
+def _l2_normalize(embeddings) -> List[List[float]]:
+    """Scale each row to unit length (zero vectors are left as-is)."""
+    arr = np.asarray(embeddings, dtype=np.float32)
+    if arr.size == 0:
+        return []
+    norms = np.linalg.norm(arr, axis=1, keepdims=True)
+    np.divide(arr, np.where(norms == 0, 1, norms), out=arr)
+    return arr.tolist()
+
+
 class EmbeddingClient:
-    """Unified embedding client."""
+    """
+    Unified embedding client.
+    
+    All vectors returned by ``embed`` are L2-normalized, so cosine similarity
+    between them is a plain dot product.
+    """
+    
+    # Embeddings are normalized to unit length at generation time
+    embedding_normalized = True
     
     def __init__(
         self,
@@ -27,15 +44,15 @@ class EmbeddingClient:
         api_key: Optional[str] = None,
         batch_size: int = 100
     ):
-        self.provider = provider or settings.embedding.provider
-        self.model = model or settings.embedding.model
-        self.batch_size = batch_size or settings.embedding.batch_size
+        self.provider = provider or get_settings().embedding.provider
+        self.model = model or get_settings().embedding.model
+        self.batch_size = batch_size or get_settings().embedding.batch_size
         
         if self.provider == "openai":
-            api_key = api_key or settings.llm.openai_api_key
+            api_key = api_key or get_settings().llm.openai_api_key
             if not api_key:
                 raise EmbeddingError("OpenAI API key not configured")
-            self.client = AsyncOpenAI(api_key=api_key)
+            self.client = _get_provider_client(LLMProvider.OPENAI, api_key)
             self._local_model = None
         elif self.provider == "local":
             # Lazy load local model
@@ -43,11 +60,19 @@ class EmbeddingClient:
             self.client = None
         else:
             raise EmbeddingError(f"Unsupported embedding provider: {self.provider}")
+        
+        # Bind the provider implementation once instead of branching per call
+        self._embed_impl = {
+            "openai": self._embed_openai,
+            "local": self._embed_local,
+        }[self.provider]
     
     def _get_local_model(self):
         """Lazy load local embedding model."""
         if self._local_model is None:
             try:
+                # Deferred: importing sentence_transformers pulls in torch
+                from sentence_transformers import SentenceTransformer
                 self._local_model = SentenceTransformer(self.model)
             except Exception as e:
                 raise EmbeddingError(f"Failed to load local model {self.model}: {str(e)}") from e
@@ -74,12 +99,7 @@ class EmbeddingClient:
         
         batch_size = batch_size or self.batch_size
         
-        if self.provider == "openai":
-            embeddings = await self._embed_openai(texts, batch_size)
-        elif self.provider == "local":
-            embeddings = await self._embed_local(texts, batch_size)
-        else:
-            raise EmbeddingError(f"Unsupported provider: {self.provider}")
+        embeddings = await self._embed_impl(texts, batch_size)
         
         return embeddings[0] if is_single else embeddings
     
@@ -100,7 +120,7 @@ class EmbeddingClient:
             except Exception as e:
                 raise EmbeddingError(f"OpenAI embedding failed: {str(e)}") from e
         
-        return all_embeddings
+        return _l2_normalize(all_embeddings)
     
     async def _embed_local(self, texts: List[str], batch_size: int) -> List[List[float]]:
         """Generate embeddings using local model."""
@@ -118,21 +138,25 @@ class EmbeddingClient:
                     show_progress_bar=False,
                     convert_to_numpy=True
                 )
-                # Convert to list of lists
-                all_embeddings.extend(embeddings.tolist())
+                all_embeddings.extend(embeddings)
             except Exception as e:
                 raise EmbeddingError(f"Local embedding failed: {str(e)}") from e
         
-        return all_embeddings
+        return _l2_normalize(all_embeddings)
     
     def cosine_similarity(
         self,
         vec1: List[float],
         vec2: List[float]
     ) -> float:
-        """Calculate cosine similarity between two vectors."""
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
+        """
+        Calculate cosine similarity between two vectors.
+        
+        Any vectors are accepted; the norm division is cheap next to the dot
+        product, so ``embed`` output gets no separate fast path.
+        """
+        v1 = np.asarray(vec1, dtype=np.float64)
+        v2 = np.asarray(vec2, dtype=np.float64)
         
         dot_product = np.dot(v1, v2)
         norm1 = np.linalg.norm(v1)
@@ -0,0 +1,20 @@
+"""
+JSON encode/decode helpers that use orjson when installed.
+"""
+
+import json
+from typing import Any
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+# parse failures from either backend the same way
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(data: Any) -> str:
+        """Serialize to a JSON string."""
+        return orjson.dumps(data).decode()
+except ImportError:
+    loads = json.loads
+    dumps = json.dumps
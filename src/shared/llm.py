@@ -4,15 +4,32 @@ Provides async completion with structured JSON output support.
 """
 
 import json
-from typing import Optional, Dict, Any, List, Literal
+import re
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Literal, Tuple
 from enum import Enum
 
 from openai import AsyncOpenAI
-from anthropic import AsyncAnthropic
 
-from src.shared.config import settings
+from src.shared.config import get_settings
 from src.shared.exceptions import TAiError
 
+# Rendered schema artifacts kept per LLMClient, oldest evicted first. Callers
+# pass module-level schema constants, so entries are keyed by id(); a schema
+# dict built per call falls back to a key on its canonical JSON.
+_SCHEMA_CACHE_SIZE = 32
+
+
+def _bounded_put(cache: Dict[Any, Any], key: Any, value: Any):
+    """Insert into a size-capped dict, dropping the oldest entry when full."""
+    if len(cache) >= _SCHEMA_CACHE_SIZE:
+        # Dicts keep insertion order
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+# Leading ```/```json and trailing ``` markdown fences around JSON responses
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```\s*$", re.DOTALL)
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
@@ -25,6 +42,23 @@ class LLMError(TAiError):
     pass
 
 
+@lru_cache(maxsize=4)
+def _get_provider_client(provider: str, api_key: str) -> Any:
+    """
+    Get the process-wide SDK client for a provider/key pair.
+    
+    SDK clients own an httpx connection pool, so they are shared across
+    LLMClient and EmbeddingClient instances instead of rebuilt per instance.
+    """
+    if provider == LLMProvider.OPENAI:
+        return AsyncOpenAI(api_key=api_key)
+    if provider == LLMProvider.ANTHROPIC:
+        # Imported lazily so OpenAI-only deployments never load the SDK
+        from anthropic import AsyncAnthropic
+        return AsyncAnthropic(api_key=api_key)
+    raise LLMError(f"Unsupported provider: {provider}")
+
+
 class LLMClient:
     """Unified LLM client supporting multiple providers."""
     
@@ -36,24 +70,36 @@ class LLMClient:
         temperature: float = 0.0,
         max_tokens: int = 2000
     ):
-        self.provider = provider or settings.llm.provider
-        self.model = model or settings.llm.default_model
+        self.provider = provider or get_settings().llm.provider
+        self.model = model or get_settings().llm.default_model
         self.temperature = temperature
         self.max_tokens = max_tokens
         
+        # Per-schema rendered artifacts: id(schema) -> (schema, artifact), and
+        # canonical JSON -> artifact for schemas that are rebuilt per call.
+        # Schemas are treated as immutable once passed in.
+        self._schema_cache: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+        self._schema_content_cache: Dict[str, Any] = {}
+        
         # Initialize provider client
         if self.provider == LLMProvider.OPENAI:
-            api_key = api_key or settings.llm.openai_api_key
+            api_key = api_key or get_settings().llm.openai_api_key
             if not api_key:
                 raise LLMError("OpenAI API key not configured")
-            self.client = AsyncOpenAI(api_key=api_key)
+            self.client = _get_provider_client(LLMProvider.OPENAI, api_key)
         elif self.provider == LLMProvider.ANTHROPIC:
-            api_key = api_key or settings.llm.anthropic_api_key
+            api_key = api_key or get_settings().llm.anthropic_api_key
             if not api_key:
                 raise LLMError("Anthropic API key not configured")
-            self.client = AsyncAnthropic(api_key=api_key)
+            self.client = _get_provider_client(LLMProvider.ANTHROPIC, api_key)
         else:
             raise LLMError(f"Unsupported provider: {self.provider}")
+        
+        # Bind the provider implementation once instead of branching per call
+        self._complete = {
+            LLMProvider.OPENAI: self._openai_completion,
+            LLMProvider.ANTHROPIC: self._anthropic_completion,
+        }[self.provider]
     
     async def get_completion(
         self,
@@ -85,26 +131,15 @@ class LLMClient:
         max_tokens = max_tokens or self.max_tokens
         
         try:
-            if self.provider == LLMProvider.OPENAI:
-                return await self._openai_completion(
-                    prompt=prompt,
-                    system_prompt=system_prompt,
-                    model=model,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    response_format=response_format,
-                    **kwargs
-                )
-            elif self.provider == LLMProvider.ANTHROPIC:
-                return await self._anthropic_completion(
-                    prompt=prompt,
-                    system_prompt=system_prompt,
-                    model=model,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    response_format=response_format,
-                    **kwargs
-                )
+            return await self._complete(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=response_format,
+                **kwargs
+            )
         except Exception as e:
             raise LLMError(f"LLM completion failed: {str(e)}") from e
     
@@ -165,7 +200,10 @@ class LLMClient:
         if response_format and system_prompt:
             schema = response_format.get("schema", {})
             if schema:
-                json_schema_instruction = f"\n\nYou must respond with valid JSON matching this schema: {json.dumps(schema, indent=2)}"
+                json_schema_instruction = self._cached_for_schema(
+                    schema,
+                    lambda: f"\n\nYou must respond with valid JSON matching this schema: {json.dumps(schema, indent=2)}"
+                )
                 completion_kwargs["system"] = system_prompt + json_schema_instruction
         
         completion_kwargs["messages"] = [{"role": "user", "content": prompt}]
@@ -173,6 +211,22 @@ class LLMClient:
         response = await self.client.messages.create(**completion_kwargs)
         return response.content[0].text
     
+    def _cached_for_schema(self, schema: Dict[str, Any], build) -> Any:
+        """Return the artifact rendered from ``schema``, building it on first use."""
+        # The entry holds a reference to the schema, so its id() cannot be
+        # reused by another object while cached; the identity check is a guard
+        entry = self._schema_cache.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            return entry[1]
+        
+        key = json.dumps(schema, sort_keys=True)
+        artifact = self._schema_content_cache.get(key)
+        if artifact is None:
+            artifact = build()
+            _bounded_put(self._schema_content_cache, key, artifact)
+        _bounded_put(self._schema_cache, id(schema), (schema, artifact))
+        return artifact
+    
     async def get_structured_completion(
         self,
         prompt: str,
@@ -196,14 +250,17 @@ class LLMClient:
         """
         if self.provider == LLMProvider.OPENAI:
             # OpenAI structured output
-            response_format = {
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "response",
-                    "schema": schema,
-                    "strict": True
+            response_format = self._cached_for_schema(
+                schema,
+                lambda: {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": "response",
+                        "schema": schema,
+                        "strict": True
+                    }
                 }
-            }
+            )
         else:
             # Anthropic uses schema in system prompt
             response_format = {"schema": schema}
@@ -219,14 +276,7 @@ class LLMClient:
         # Parse JSON response
         try:
             # Remove markdown code fences if present
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            return json.loads(response_text.strip())
+            return json.loads(_FENCE_RE.sub("", response_text).strip())
         except json.JSONDecodeError as e:
             raise LLMError(f"Failed to parse JSON response: {str(e)}\nResponse: {response_text[:200]}") from e
 
@@ -3,14 +3,56 @@ Structured JSON logging for TAi.
 Includes student_id (anonymized), action, and timestamp in every log.
 """
 
-import json
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
-from src.shared.config import settings
+from src.shared.config import get_settings
+from src.shared.json_utils import dumps as _dumps
+
+
+# LogRecord attributes (and fields handled explicitly) that are not extras
+_RESERVED = frozenset({
+    "name", "msg", "args", "created", "filename", "funcName",
+    "levelname", "levelno", "lineno", "module", "msecs",
+    "message", "pathname", "process", "processName", "relativeCreated",
+    "thread", "threadName", "taskName", "exc_info", "exc_text", "stack_info",
+    "student_id", "action", "session_id",
+})
+
+# (epoch second, ISO string) of the most recently formatted timestamp
+_ts_cache = (0, "")
+
+
+def _fmt_ts(created: float) -> str:
+    """Format a LogRecord creation time as ISO-8601, reusing the per-second prefix."""
+    global _ts_cache
+    sec = int(created)
+    if _ts_cache[0] != sec:
+        # Naive UTC isoformat (no "+00:00"), matching the previous output
+        _ts_cache = (sec, datetime.fromtimestamp(sec, tz=timezone.utc).replace(tzinfo=None).isoformat())
+    ms = int((created - sec) * 1000)
+    return f"{_ts_cache[1]}.{ms:03d}"
+
+
+# Background thread that drains queued records to the log file
+_queue_listener: Optional[QueueListener] = None
+
+# Whether setup_logging() has run; get_logger() configures logging once if not
+_configured = False
+
+
+def _stop_queue_listener():
+    """Flush and stop the file-logging listener thread, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
 
 
 class StructuredFormatter(logging.Formatter):
@@ -19,7 +61,7 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _fmt_ts(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -41,14 +83,10 @@ class StructuredFormatter(logging.Formatter):
         
         # Add any extra fields
         for key, value in record.__dict__.items():
-            if key not in ["name", "msg", "args", "created", "filename", "funcName",
-                          "levelname", "levelno", "lineno", "module", "msecs",
-                          "message", "pathname", "process", "processName", "relativeCreated",
-                          "thread", "threadName", "exc_info", "exc_text", "stack_info",
-                          "student_id", "action", "session_id"]:
-                log_data[key] = str(value)
+            if key not in _RESERVED:
+                log_data[key] = value if isinstance(value, (str, int, float, bool)) else str(value)
         
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 def setup_logging(
@@ -62,8 +100,11 @@ def setup_logging(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional file path for file logging
     """
-    log_level = log_level or settings.log_level
-    log_file = log_file or settings.log_file
+    global _configured
+    _configured = True
+    
+    log_level = log_level or get_settings().log_level
+    log_file = log_file or get_settings().log_file
     
     # Create log directory if needed
     if log_file:
@@ -78,23 +119,38 @@ def setup_logging(
     
     # Remove existing handlers
     root_logger.handlers.clear()
+    _stop_queue_listener()
     
     # Console handler (stdout)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
     
-    # File handler
+    # File handler: records are formatted on the calling thread by the
+    # QueueHandler, and a listener thread does the disk writes
     if log_file:
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        global _queue_listener
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=50_000_000,
+            backupCount=5,
+            encoding="utf-8",
+            delay=True
+        )
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(formatter)
+        _queue_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _queue_listener.start()
+        root_logger.addHandler(queue_handler)
     
     return root_logger
 
 
 def get_logger(name: str) -> logging.Logger:
-    """Get a logger with the given name."""
+    """Get a logger with the given name, setting up logging on first use."""
+    if not _configured:
+        setup_logging()
     return logging.getLogger(name)
 
 
@@ -119,6 +175,10 @@ def log_with_context(
         session_id: Optional session ID
         **kwargs: Additional structured fields
     """
+    # Skip building the extra dict when the record would be dropped anyway
+    if not logger.isEnabledFor(level):
+        return
+    
     extra = {}
     if student_id:
         extra["student_id"] = student_id
@@ -128,8 +188,7 @@ def log_with_context(
         extra["session_id"] = session_id
     extra.update(kwargs)
     
-    logger.log(level, message, extra=extra)
+    logger.log(level, message, extra=extra or None)
 
 
-# Initialize logging on import
-setup_logging()
+atexit.register(_stop_queue_listener)
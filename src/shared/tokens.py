@@ -5,7 +5,7 @@ Token counting and truncation utilities using tiktoken.
 from typing import Optional
 import tiktoken
 
-from src.shared.config import settings
+from src.shared.config import get_settings
 
 
 def get_encoding(model: Optional[str] = None) -> tiktoken.Encoding:
@@ -19,7 +19,7 @@ def get_encoding(model: Optional[str] = None) -> tiktoken.Encoding:
     Returns:
         tiktoken Encoding object
     """
-    model = model or settings.llm.default_model
+    model = model or get_settings().llm.default_model
     
     try:
         encoding = tiktoken.encoding_for_model(model)
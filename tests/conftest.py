@@ -2,60 +2,242 @@
 Pytest fixtures for TAi tests.
 """
 
+import asyncio
+import collections
+import os
 import pytest
+import shutil
 import sqlite3
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Dict, Any
 import json
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
-# Try to import testcontainers, but skip if unavailable
 try:
-    from testcontainers.neo4j import Neo4jContainer
-    HAS_TESTCONTAINERS = True
-except ImportError:
-    HAS_TESTCONTAINERS = False
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+# Dummy embedding (1536 dimensions), allocated once for the session
+DUMMY_EMBEDDING = [0.1] * 1536
+
+_SAMPLE_TRANSCRIPT_BYTES = (
+    b"Lecture 1: Introduction to Distributed Systems\n"
+    b"Today we'll cover MapReduce and consensus protocols.\n"
+    b"Let's start with the basics."
+)
+
+_SAMPLE_ASSIGNMENT_BYTES = (
+    b"# Assignment 1: MapReduce Implementation\n\n"
+    b"## Requirements\n"
+    b"- Implement Map and Reduce functions\n"
+    b"- Handle failure scenarios\n\n"
+    b"## Grading\n"
+    b"- Correctness: 50%\n"
+    b"- Code quality: 30%\n"
+    b"- Testing: 20%"
+)
+
+_SAMPLE_CODE_BYTES = (
+    b"package main\n\n"
+    b"// RaftLeader implements leader election in Raft protocol\n"
+    b"func RaftLeader() {\n"
+    b"    // Leader election logic\n"
+    b"}\n"
+)
+
+_SAMPLE_DISCUSSION_BYTES = json.dumps({
+    "posts": [
+        {
+            "id": "post1",
+            "author": "student_123",
+            "content": "I don't understand how Raft handles leader failure.",
+            "type": "question",
+            "timestamp": "2024-01-15T10:00:00Z"
+        },
+        {
+            "id": "post2",
+            "author": "student_456",
+            "content": "Raft uses a timeout mechanism to detect leader failure.",
+            "type": "answer",
+            "timestamp": "2024-01-15T10:30:00Z"
+        }
+    ]
+}, indent=2).encode()
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when installed, falling back to the stdlib loop."""
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+def pytest_configure(config):
+    """Send logs and runtime databases to a temp dir, never into the source tree."""
+    runtime = Path(tempfile.mkdtemp(prefix="tai-tests-"))
+    config.tai_runtime_dir = runtime
+    # Set before any src import: settings are built once and then cached
+    os.environ["WAL_PATH"] = str(runtime / "data" / "wal.sqlite")
+    os.environ["SESSION_DB_PATH"] = str(runtime / "data" / "sessions.sqlite")
+    os.environ["PROFILE_CACHE_PATH"] = str(runtime / "data" / "profile_cache.sqlite")
+    
+    # config/tai.yaml pins log_file, so pass it explicitly rather than via LOG_FILE
+    from src.shared.logging import setup_logging
+    setup_logging(log_file=runtime / "logs" / "tai.log")
+
+
+def pytest_unconfigure(config):
+    """Stop file logging and remove the runtime temp dir."""
+    runtime = getattr(config, "tai_runtime_dir", None)
+    if runtime is not None:
+        from src.shared.logging import _stop_queue_listener
+        _stop_queue_listener()
+        shutil.rmtree(runtime, ignore_errors=True)
+
+
+def pytest_collection_modifyitems(items):
+    """Keep memory tests that share a module's SQLite fixtures on one xdist worker."""
+    for item in items:
+        if "memory/" in item.nodeid:
+            item.add_marker(pytest.mark.xdist_group(name=item.module.__name__))
 
 
 @pytest.fixture(scope="session")
 def neo4j_container():
-    """Neo4j test container fixture."""
-    if not HAS_TESTCONTAINERS:
-        pytest.skip("testcontainers not available")
+    """Neo4j test container fixture; skips when testcontainers or Docker is missing."""
+    # Imported lazily: testcontainers pulls in docker/requests, which unit-only
+    # runs never need.
+    testcontainers_neo4j = pytest.importorskip("testcontainers.neo4j")
+    
+    try:
+        # The constructor already talks to the Docker daemon
+        container = testcontainers_neo4j.Neo4jContainer("neo4j:5.15-community")
+        container.start()
+    except Exception as e:
+        pytest.skip(f"Neo4j container unavailable: {e}")
     
-    with Neo4jContainer("neo4j:5.15-community") as container:
+    try:
         yield container
+    finally:
+        container.stop()
 
 
-@pytest.fixture
-def neo4j_driver(neo4j_container):
-    """Neo4j driver fixture."""
-    if not HAS_TESTCONTAINERS:
-        # Return mock driver for tests that don't need real Neo4j
-        return MagicMock()
-    
-    from neo4j import GraphDatabase
+@pytest.fixture(scope="session")
+async def neo4j_driver(neo4j_container):
+    """Async Neo4j driver; one connection pool shared by the whole session."""
+    neo4j = pytest.importorskip("neo4j")
     
     uri = neo4j_container.get_connection_url()
-    driver = GraphDatabase.driver(uri, auth=("neo4j", neo4j_container.password))
+    driver = neo4j.AsyncGraphDatabase.driver(
+        uri,
+        auth=("neo4j", neo4j_container.password),
+        max_connection_pool_size=50
+    )
+    try:
+        await driver.verify_connectivity()
+    except Exception as e:
+        await driver.close()
+        pytest.skip(f"Neo4j unavailable: {e}")
     
     yield driver
     
-    driver.close()
+    await driver.close()
+
+
+@pytest.fixture(scope="session")
+async def neo4j_connection(neo4j_container, neo4j_driver):
+    """Global get_connection() pointed at the test container for the session."""
+    from src.graph import connection as graph_connection
+    
+    connection = graph_connection.Neo4jConnection(
+        uri=neo4j_container.get_connection_url(),
+        user="neo4j",
+        password=neo4j_container.password
+    )
+    # Pipelines, schema setup and retrieval all resolve the graph through
+    # get_connection(), not through a driver passed in
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(graph_connection, "_connection", connection)
+        yield connection
+    
+    await connection.close()
 
 
 @pytest.fixture
+async def neo4j_clean(neo4j_driver, neo4j_connection):
+    """Session Neo4j driver that wipes the graph after the test."""
+    yield neo4j_driver
+    
+    async with neo4j_driver.session() as session:
+        await session.run("MATCH (n) DETACH DELETE n")
+
+
+@pytest.fixture(scope="session")
 def in_memory_db():
-    """SQLite in-memory database fixture."""
+    """SQLite in-memory database shared by the whole test session."""
     conn = sqlite3.connect(":memory:")
-    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL is a no-op for :memory:; tune for speed instead
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    conn.execute("PRAGMA temp_store=MEMORY")
     yield conn
     conn.close()
 
 
 @pytest.fixture
-def mock_llm():
-    """Mock LLM client that returns canned JSON."""
+def db(in_memory_db):
+    """Shared in-memory database, rolled back to a savepoint after each test."""
+    in_memory_db.execute("SAVEPOINT t")
+    yield in_memory_db
+    in_memory_db.execute("ROLLBACK TO t")
+    in_memory_db.execute("RELEASE t")
+
+
+@pytest.fixture(scope="session")
+def _session_memory_store(in_memory_db, tmp_path_factory):
+    """SafeMemoryStore on the shared connection; schema is created once here."""
+    from src.memory.store import SafeMemoryStore
+    
+    class SharedConnectionStore(SafeMemoryStore):
+        """Runs every operation on the session connection instead of a new one."""
+        
+        @contextmanager
+        def _get_connection(self):
+            # No commit or close: writes stay in the db fixture's savepoint
+            yield in_memory_db
+    
+    in_memory_db.row_factory = sqlite3.Row
+    # Built before any test savepoint: executescript would commit an open one.
+    # The file path is never opened.
+    return SharedConnectionStore(tmp_path_factory.mktemp("memory") / "wal.sqlite")
+
+
+@pytest.fixture
+def memory_store(_session_memory_store, db):
+    """SafeMemoryStore whose writes are rolled back after each test."""
+    yield _session_memory_store
+    # Consent granted inside the rolled-back savepoint must not outlive it
+    _session_memory_store._consent_cache.clear()
+
+
+def _set_llm_defaults(mock: AsyncMock):
+    """Apply the default canned LLM responses."""
+    mock.get_completion.return_value = '{"entities": [], "relationships": []}'
+    mock.get_structured_completion.return_value = {"entities": [], "relationships": []}
+
+
+def _set_embedding_defaults(mock: AsyncMock):
+    """Return the shared dummy embedding."""
+    mock.embed.return_value = DUMMY_EMBEDDING
+    mock.cosine_similarity.return_value = 0.85
+
+
+@pytest.fixture(scope="session")
+def _session_mock_llm():
+    """Mock LLM client built once per session."""
     mock = AsyncMock()
     
     def set_response(response_text: str):
@@ -63,36 +245,107 @@ def mock_llm():
         mock.get_completion.return_value = response_text
         mock.get_structured_completion.return_value = json.loads(response_text)
     
-    # Default response
-    mock.get_completion.return_value = '{"entities": [], "relationships": []}'
-    mock.get_structured_completion.return_value = {"entities": [], "relationships": []}
+    _set_llm_defaults(mock)
     mock.set_response = set_response
     
     return mock
 
 
+class FakeLLM:
+    """Scripted LLM: each call pops the next response; exceptions are raised."""
+    
+    def __init__(self, responses):
+        self.responses = collections.deque(responses)
+    
+    def _next(self):
+        value = self.responses.popleft()
+        if isinstance(value, Exception):
+            raise value
+        return value
+    
+    async def get_completion(self, *args, **kwargs):
+        return self._next()
+    
+    async def get_structured_completion(self, *args, **kwargs):
+        return self._next()
+
+
 @pytest.fixture
-def mock_embedding():
-    """Mock embedding client."""
+def fake_llm():
+    """Factory for a FakeLLM that returns the given responses in order."""
+    return FakeLLM
+
+
+@pytest.fixture(scope="session")
+def _session_mock_embedding():
+    """Mock embedding client built once per session."""
     mock = AsyncMock()
+    _set_embedding_defaults(mock)
+    return mock
+
+
+@pytest.fixture
+def mock_llm(_session_mock_llm):
+    """Mock LLM client that returns canned JSON."""
+    yield _session_mock_llm
+    # Clear call history and per-test overrides
+    _session_mock_llm.reset_mock(return_value=True, side_effect=True)
+    _set_llm_defaults(_session_mock_llm)
+
+
+@pytest.fixture
+def mock_embedding(_session_mock_embedding):
+    """Mock embedding client."""
+    yield _session_mock_embedding
+    # Clear call history and per-test overrides
+    _session_mock_embedding.reset_mock(return_value=True, side_effect=True)
+    _set_embedding_defaults(_session_mock_embedding)
+
+
+@pytest.fixture(scope="session")
+def _session_client():
+    """FastAPI test client; the app lifespan runs once per session."""
+    from fastapi.testclient import TestClient
+    from src.api.app import app
     
-    # Return dummy embeddings (1536 dimensions)
-    dummy_embedding = [0.1] * 1536
-    mock.embed.return_value = dummy_embedding
-    mock.cosine_similarity.return_value = 0.85
+    with TestClient(app) as tc:
+        yield tc
+
+
+@pytest.fixture
+def reset_app_state():
+    """Empty the rate-limit buckets and /health cache around each test."""
+    from src.api.app import app
+    from src.api.routes import health
     
-    return mock
+    app.state.rate_limiter.clear()
+    health.clear_cache()
+    yield
+    app.state.rate_limiter.clear()
+    health.clear_cache()
 
 
 @pytest.fixture
-def test_data_dir(tmp_path):
-    """Temporary test data directory."""
-    data_dir = tmp_path / "test_data"
-    data_dir.mkdir()
-    return data_dir
+def client(_session_client, reset_app_state):
+    """Session test client with per-test app state, so test order cannot leak hits."""
+    return _session_client
+
+
+@pytest.fixture(scope="session")
+def test_data_dir(tmp_path_factory):
+    """Temporary test data directory shared (read-only) by the session."""
+    return tmp_path_factory.mktemp("test_data")
 
 
 @pytest.fixture
+def workspace_dir(test_data_dir, tmp_path):
+    """Per-test writable copy of the shared test data directory."""
+    workspace = tmp_path / "test_data"
+    shutil.copytree(test_data_dir, workspace)
+    return workspace
+
+
+@pytest.fixture(scope="session")
 def sample_slide_pdf(test_data_dir):
     """Create a minimal test PDF fixture."""
     # This would create an actual PDF in a real implementation
@@ -103,7 +356,7 @@ def sample_slide_pdf(test_data_dir):
     return pdf_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_paper_pdf(test_data_dir):
     """Create a minimal test paper PDF fixture."""
     pdf_path = test_data_dir / "sample_paper.pdf"
@@ -111,70 +364,49 @@ def sample_paper_pdf(test_data_dir):
     return pdf_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript(test_data_dir):
     """Create a minimal test transcript fixture."""
     transcript_path = test_data_dir / "sample_transcript.txt"
-    transcript_path.write_text(
-        "Lecture 1: Introduction to Distributed Systems\n"
-        "Today we'll cover MapReduce and consensus protocols.\n"
-        "Let's start with the basics."
-    )
+    transcript_path.write_bytes(_SAMPLE_TRANSCRIPT_BYTES)
     return transcript_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_assignment(test_data_dir):
     """Create a minimal test assignment fixture."""
     assignment_path = test_data_dir / "sample_assignment.md"
-    assignment_path.write_text(
-        "# Assignment 1: MapReduce Implementation\n\n"
-        "## Requirements\n"
-        "- Implement Map and Reduce functions\n"
-        "- Handle failure scenarios\n\n"
-        "## Grading\n"
-        "- Correctness: 50%\n"
-        "- Code quality: 30%\n"
-        "- Testing: 20%"
-    )
+    assignment_path.write_bytes(_SAMPLE_ASSIGNMENT_BYTES)
     return assignment_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_discussion(test_data_dir):
     """Create a minimal test discussion fixture."""
     discussion_path = test_data_dir / "sample_discussion.json"
-    discussion_data = {
-        "posts": [
-            {
-                "id": "post1",
-                "author": "student_123",
-                "content": "I don't understand how Raft handles leader failure.",
-                "type": "question",
-                "timestamp": "2024-01-15T10:00:00Z"
-            },
-            {
-                "id": "post2",
-                "author": "student_456",
-                "content": "Raft uses a timeout mechanism to detect leader failure.",
-                "type": "answer",
-                "timestamp": "2024-01-15T10:30:00Z"
-            }
-        ]
-    }
-    discussion_path.write_text(json.dumps(discussion_data, indent=2))
+    discussion_path.write_bytes(_SAMPLE_DISCUSSION_BYTES)
     return discussion_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_code_file(test_data_dir):
     """Create a minimal test code file fixture."""
     code_path = test_data_dir / "sample_code.go"
-    code_path.write_text(
-        "package main\n\n"
-        "// RaftLeader implements leader election in Raft protocol\n"
-        "func RaftLeader() {\n"
-        "    // Leader election logic\n"
-        "}\n"
-    )
+    code_path.write_bytes(_SAMPLE_CODE_BYTES)
     return code_path
+
+
+@pytest.fixture(scope="session")
+async def indexed_corpus(
+    neo4j_connection,
+    test_data_dir,
+    sample_transcript,
+    sample_assignment,
+    sample_discussion,
+    sample_code_file
+):
+    """Sample corpus indexed into Neo4j once; query tests share the graph."""
+    from src.core.indexing.pipeline import IndexingPipeline
+    
+    await IndexingPipeline().run(test_data_dir, mode="full")
+    return test_data_dir
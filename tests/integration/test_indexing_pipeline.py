@@ -9,11 +9,11 @@ import tempfile
 from src.core.indexing.pipeline import IndexingPipeline
 
 
-@pytest.mark.asyncio
-async def test_indexing_pipeline_end_to_end(neo4j_driver, test_data_dir):
+@pytest.mark.integration
+async def test_indexing_pipeline_end_to_end(neo4j_clean, workspace_dir):
     """Test complete pipeline: fixtures → Neo4j graph."""
     # Create test fixtures
-    assignment_path = test_data_dir / "assignment1.md"
+    assignment_path = workspace_dir / "assignment1.md"
     assignment_path.write_text(
         "# Assignment 1: Raft Implementation\n\n"
         "## Requirements\n"
@@ -26,7 +26,7 @@ async def test_indexing_pipeline_end_to_end(neo4j_driver, test_data_dir):
     
     # Run pipeline
     pipeline = IndexingPipeline()
-    stats = await pipeline.run(test_data_dir, mode="full")
+    stats = await pipeline.run(workspace_dir, mode="full")
     
     # Verify statistics
     assert stats["files_processed"] > 0
@@ -39,22 +39,22 @@ async def test_indexing_pipeline_end_to_end(neo4j_driver, test_data_dir):
     assert stats["entities_stored"] > 0
 
 
-@pytest.mark.asyncio
-async def test_incremental_mode_skips_processed_files(neo4j_driver, test_data_dir):
+@pytest.mark.integration
+async def test_incremental_mode_skips_processed_files(neo4j_clean, workspace_dir):
     """Test that incremental mode skips already processed files."""
     # Create test file
-    test_file = test_data_dir / "test.md"
+    test_file = workspace_dir / "test.md"
     test_file.write_text("# Test Document")
     
     # Run pipeline twice
     pipeline = IndexingPipeline()
     
     # First run
-    stats1 = await pipeline.run(test_data_dir, mode="full")
+    stats1 = await pipeline.run(workspace_dir, mode="full")
     files_first = stats1["files_processed"]
     
     # Second run (incremental)
-    stats2 = await pipeline.run(test_data_dir, mode="incremental")
+    stats2 = await pipeline.run(workspace_dir, mode="incremental")
     files_second = stats2["files_processed"]
     
     # Second run should process fewer files (or zero if all processed)
@@ -5,13 +5,12 @@ End-to-end test: index docs → ask question → get cited answer.
 import pytest
 
 from src.core.pipeline import TAiPipeline
-from src.core.indexing.pipeline import IndexingPipeline
 from src.safety.consent import ConsentManager
 from src.memory.store import SafeMemoryStore
 
 
-@pytest.mark.asyncio
-async def test_end_to_end_query_pipeline(neo4j_driver, test_data_dir):
+@pytest.mark.integration
+async def test_end_to_end_query_pipeline(indexed_corpus):
     """Test complete pipeline: index → query → answer."""
     # Setup consent
     memory_store = SafeMemoryStore()
@@ -21,10 +20,6 @@ async def test_end_to_end_query_pipeline(neo4j_driver, test_data_dir):
     session_token = "test_token_123"
     consent_manager.grant_consent("test_student", "I CONSENT", session_token)
     
-    # Index test documents
-    indexing_pipeline = IndexingPipeline()
-    await indexing_pipeline.run(test_data_dir, mode="full")
-    
     # Ask question
     tai_pipeline = TAiPipeline()
     response = await tai_pipeline.ask(
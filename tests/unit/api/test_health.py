@@ -1,18 +1,14 @@
 """
 Tests for health endpoint.
-"""
-
-import pytest
-from fastapi.testclient import TestClient
 
-from src.api.app import app
+These are read-only GETs, so they use the conftest ``client`` fixture: the app
+lifespan runs once per session, and the rate limiter and /health cache are
+reset for each test.
+"""
 
+from unittest.mock import AsyncMock, MagicMock, patch
 
-@pytest.fixture
-def client():
-    """Create test client (runs lifespan for app.state)."""
-    with TestClient(app) as tc:
-        yield tc
+from src.api.dependencies import get_memory_store, get_worker
 
 
 def test_health_returns_correct_structure(client):
@@ -53,3 +49,61 @@ def test_cors_headers_present(client):
     # CORS middleware adds Access-Control-Allow-Origin when Origin matches
     allow_origin = response.headers.get("access-control-allow-origin")
     assert allow_origin == "http://localhost:3000"
+
+
+def test_health_cache_miss_then_hit(client):
+    """A successful Neo4j probe is cached: first call misses, second call hits."""
+    connection = MagicMock()
+    connection.health_check = AsyncMock(return_value=True)
+
+    with patch("src.api.routes.health.get_connection", return_value=connection):
+        first = client.get("/health")
+        second = client.get("/health")
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["cache-control"] == "no-store"
+    assert connection.health_check.await_count == 1
+    assert second.json()["status"] == "healthy"
+
+
+def test_health_cache_hit_reports_fresh_breaker_state(client):
+    """Circuit breaker and WAL state are recomputed on a probe cache hit."""
+    from src.api.app import app
+
+    connection = MagicMock()
+    connection.health_check = AsyncMock(return_value=True)
+    worker = MagicMock()
+    worker.circuit_breaker.state = "CLOSED"
+    store = MagicMock()
+    store.get_unsynced_facts.return_value = []
+
+    app.dependency_overrides[get_worker] = lambda: worker
+    app.dependency_overrides[get_memory_store] = lambda: store
+    try:
+        with patch("src.api.routes.health.get_connection", return_value=connection):
+            first = client.get("/health")
+            worker.circuit_breaker.state = "OPEN"
+            store.get_unsynced_facts.return_value = [object()] * 3
+            second = client.get("/health")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert second.headers["x-cache"] == "HIT"
+    assert first.json()["circuit_breaker_state"] == "CLOSED"
+    assert second.json()["circuit_breaker_state"] == "OPEN"
+    assert second.json()["wal_backlog_depth"] == 3
+
+
+def test_health_degraded_not_cached(client):
+    """Degraded responses bypass the cache."""
+    connection = MagicMock()
+    connection.health_check = AsyncMock(return_value=False)
+
+    with patch("src.api.routes.health.get_connection", return_value=connection):
+        client.get("/health")
+        response = client.get("/health")
+
+    assert response.headers["x-cache"] == "MISS"
+    assert response.headers["cache-control"] == "no-store"
+    assert connection.health_check.await_count == 2
@@ -2,28 +2,26 @@
 Tests for rate limit middleware.
 """
 
+import asyncio
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 
 from src.api.app import app
 
-
-@pytest.fixture
-def client():
-    """Create test client (runs lifespan for app.state)."""
-    with TestClient(app) as tc:
-        yield tc
+# Start every test with empty rate-limit buckets
+pytestmark = pytest.mark.usefixtures("reset_app_state")
 
 
-def test_rate_limiter_returns_429_after_threshold(client):
+async def test_rate_limiter_returns_429_after_threshold():
     """Rate limiter returns 429 with Retry-After after threshold exceeded."""
-    # Root "/" is rate limited. Use X-Rate-Limit-Key for consistent client ID (TestClient has no IP)
+    # Root "/" is rate limited. All requests share one client identity, so they hit one bucket
     headers = {"X-Rate-Limit-Key": "test-student-001"}
-    # Default: 30 requests/minute. Make 31 requests from same key
-    for i in range(31):
-        response = client.get("/", headers=headers)
-        if response.status_code == 429:
-            retry_after = response.headers.get("retry-after") or response.headers.get("Retry-After")
-            assert retry_after is not None
-            return  # Pass: got 429 as expected
-    pytest.fail("Expected 429 after 31 requests, all succeeded")
+    transport = httpx.ASGITransport(app=app)
+    # Default: 30 requests/minute. Make 31 requests from same key in one batch
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as ac:
+        responses = await asyncio.gather(*[ac.get("/", headers=headers) for _ in range(31)])
+
+    limited = [r for r in responses if r.status_code == 429]
+    assert limited, "Expected 429 after 31 requests, all succeeded"
+    assert limited[0].headers.get("retry-after") is not None
@@ -9,29 +9,29 @@ import igraph as ig
 from src.core.indexing.community import CommunityDetector, Community
 
 
-def test_leiden_produces_communities():
+@pytest.fixture(scope="module")
+def detector():
+    """Community detector shared by the module."""
+    return CommunityDetector()
+
+
+def test_leiden_produces_communities(detector):
     """Test that Leiden algorithm produces communities from a small graph."""
-    detector = CommunityDetector()
-    
-    # Create a small test graph (10 nodes, 15 edges)
-    graph = ig.Graph(directed=True)
-    
-    # Two clusters of nodes
-    for i in range(10):
-        graph.add_vertex(name=f"concept_{i}", label=f"Concept {i}")
-    
-    # Cluster 1: nodes 0-4 densely connected
-    for i in range(5):
-        for j in range(i + 1, 5):
-            graph.add_edge(i, j)
-    
-    # Cluster 2: nodes 5-9 densely connected
-    for i in range(5, 10):
-        for j in range(i + 1, 10):
-            graph.add_edge(i, j)
-    
-    # One bridge edge between clusters
-    graph.add_edge(4, 5)
+    # Two densely connected clusters (nodes 0-4 and 5-9) joined by one bridge edge
+    edges = (
+        [(i, j) for i in range(5) for j in range(i + 1, 5)]
+        + [(i, j) for i in range(5, 10) for j in range(i + 1, 10)]
+        + [(4, 5)]
+    )
+    graph = ig.Graph(
+        n=10,
+        edges=edges,
+        directed=True,
+        vertex_attrs={
+            "name": [f"concept_{i}" for i in range(10)],
+            "label": [f"Concept {i}" for i in range(10)],
+        },
+    )
     
     communities = detector._run_leiden(graph)
     
@@ -45,15 +45,12 @@ def test_leiden_produces_communities():
     assert len(all_nodes) == 10
 
 
-@pytest.mark.asyncio
-async def test_community_summaries_non_empty():
+async def test_community_summaries_non_empty(detector, monkeypatch):
     """Test that community summaries are non-empty strings."""
-    detector = CommunityDetector()
-    
     # Mock LLM
-    detector.llm.get_completion = AsyncMock(
+    monkeypatch.setattr(detector.llm, "get_completion", AsyncMock(
         return_value="Consensus Protocols | Covers Raft and Paxos | Themes: fault tolerance | Rank: 8"
-    )
+    ))
     
     communities = [
         Community(id="c1", nodes=["n1", "n2"], level=0),
@@ -10,6 +10,12 @@ from src.core.indexing.extractor import EntityRelationshipExtractor, Entity, Rel
 from src.core.indexing.ingestors.base import DocumentChunk
 
 
+@pytest.fixture(scope="module")
+def extractor():
+    """Extractor shared by the module; tests swap its llm via monkeypatch."""
+    return EntityRelationshipExtractor()
+
+
 @pytest.fixture
 def mock_llm():
     """Mock LLM client."""
@@ -42,16 +48,14 @@ def mock_llm():
     return mock
 
 
-@pytest.mark.asyncio
-async def test_extract_entities_from_raft_paragraph(mock_llm):
+async def test_extract_entities_from_raft_paragraph(extractor, mock_llm, monkeypatch):
     """Test extraction from known Raft paragraph."""
     chunk = DocumentChunk(
         text="Raft is a consensus protocol that implements leader election for distributed systems.",
         metadata={"source_type": "lecture_slide"}
     )
     
-    extractor = EntityRelationshipExtractor()
-    extractor.llm = mock_llm
+    monkeypatch.setattr(extractor, "llm", mock_llm)
     
     result = await extractor.extract(chunk)
     
@@ -66,8 +70,7 @@ async def test_extract_entities_from_raft_paragraph(mock_llm):
     )
 
 
-@pytest.mark.asyncio
-async def test_validate_entity_types(mock_llm):
+async def test_validate_entity_types(extractor, mock_llm, monkeypatch):
     """Test that invalid entity types are rejected."""
     # Mock LLM returning invalid type
     mock_llm.get_structured_completion.return_value = {
@@ -82,8 +85,7 @@ async def test_validate_entity_types(mock_llm):
     }
     
     chunk = DocumentChunk(text="Test content")
-    extractor = EntityRelationshipExtractor()
-    extractor.llm = mock_llm
+    monkeypatch.setattr(extractor, "llm", mock_llm)
     
     result = await extractor.extract(chunk)
     
@@ -92,19 +94,14 @@ async def test_validate_entity_types(mock_llm):
     assert result.entities[0].type == "CONCEPT"
 
 
-@pytest.mark.asyncio
-async def test_json_parse_failure_handling(mock_llm):
+async def test_json_parse_failure_handling(extractor, fake_llm, monkeypatch):
     """Test that JSON parse failures are handled gracefully."""
-    # Mock LLM returning invalid JSON
-    mock_llm.get_structured_completion.side_effect = [
-        json.JSONDecodeError("Invalid JSON", "", 0),
-        "Some text response"
-    ]
-    mock_llm.get_completion.return_value = '{"entities": [], "relationships": []}'
-    
+    # Structured call returns invalid JSON; the text retry returns an empty result
     chunk = DocumentChunk(text="Test content")
-    extractor = EntityRelationshipExtractor()
-    extractor.llm = mock_llm
+    monkeypatch.setattr(extractor, "llm", fake_llm([
+        json.JSONDecodeError("Invalid JSON", "", 0),
+        '{"entities": [], "relationships": []}'
+    ]))
     
     result = await extractor.extract(chunk)
     
@@ -113,11 +110,10 @@ async def test_json_parse_failure_handling(mock_llm):
     assert len(result.entities) == 0  # Or partial results if retry succeeds
 
 
-@pytest.mark.asyncio
-async def test_gleanings_produces_more_entities(mock_llm):
+async def test_gleanings_produces_more_entities(extractor, fake_llm, monkeypatch):
     """Test that gleanings finds additional entities."""
-    # First extraction
-    mock_llm.get_structured_completion.side_effect = [
+    # First extraction, then one gleaning round
+    llm = fake_llm([
         {
             "entities": [{"name": "Raft", "type": "PROTOCOL", "description": "Consensus"}],
             "relationships": []
@@ -128,13 +124,12 @@ async def test_gleanings_produces_more_entities(mock_llm):
                 {"source": "Raft", "target": "Paxos", "type": "ALTERNATIVE_TO", "description": ""}
             ]
         }
-    ]
+    ])
     
     chunk = DocumentChunk(
         text="Raft is a consensus protocol. Paxos is an alternative."
     )
-    extractor = EntityRelationshipExtractor()
-    extractor.llm = mock_llm
+    monkeypatch.setattr(extractor, "llm", llm)
     
     result = await extractor.extract_with_gleanings(chunk, max_rounds=2)
     
@@ -145,10 +140,8 @@ async def test_gleanings_produces_more_entities(mock_llm):
     assert len(result.relationships) > 0
 
 
-def test_entity_validation():
+def test_entity_validation(extractor):
     """Test entity type validation against schema."""
-    extractor = EntityRelationshipExtractor()
-    
     # Valid types should pass
     valid_entity = Entity(name="Test", type="CONCEPT", description="Test")
     assert valid_entity.type in extractor.allowed_entity_types
@@ -2,14 +2,12 @@
 Tests for global search (community-based map-reduce).
 """
 
-import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 
 from src.core.retrieval.global_search import GlobalSearch, GlobalSearchResult
 
 
-@pytest.mark.asyncio
-async def test_global_search_with_communities():
+async def test_global_search_with_communities(fake_llm):
     """Test that global search produces synthesized answer from community summaries."""
     search = GlobalSearch()
     
@@ -21,7 +19,7 @@ async def test_global_search_with_communities():
     
     with patch.object(search, '_load_community_summaries', return_value=mock_communities):
         # Mock LLM for map phase
-        search.llm.get_completion = AsyncMock(side_effect=[
+        search.llm = fake_llm([
             "Raft and Paxos are the main consensus approaches. Relevance: 0.9",
             "NOT_RELEVANT",  # Second community
             "Synthesized: Raft and Paxos are the primary consensus protocols.",  # Reduce
@@ -34,7 +32,6 @@ async def test_global_search_with_communities():
         assert len(result.communities_used) >= 1
 
 
-@pytest.mark.asyncio
 async def test_global_search_empty_communities():
     """Test that empty communities return graceful response."""
     search = GlobalSearch()
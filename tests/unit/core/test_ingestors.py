@@ -15,14 +15,76 @@ from src.core.indexing.ingestors.discussion import DiscussionIngestor
 from src.core.indexing.ingestors.code import CodeIngestor
 from src.core.indexing.ingestors.notes import NotesIngestor
 
+_TRANSCRIPT_BYTES = (
+    b"Lecture 1: Introduction\n"
+    b"Um, today we'll cover, uh, MapReduce.\n"
+    b"You know, it's a distributed system protocol.\n"
+    b"Like, it's really important."
+)
+
+_ASSIGNMENT_BYTES = (
+    b"# Assignment 1: MapReduce\n\n"
+    b"## Description\n"
+    b"Implement a basic MapReduce system.\n\n"
+    b"## Requirements\n"
+    b"- Implement Map function\n"
+    b"- Implement Reduce function\n"
+    b"- Handle failures\n\n"
+    b"## Grading\n"
+    b"- Correctness: 50%\n"
+    b"- Code quality: 30%"
+)
+
+_NOTES_BYTES = (
+    b"# Raft Protocol\n\n"
+    b"Raft is a consensus algorithm.\n\n"
+    b"## Leader Election\n\n"
+    b"Leaders are elected via timeouts.\n\n"
+    b"## Log Replication\n\n"
+    b"Logs are replicated to followers.\n"
+)
+
+_DISCUSSION_BYTES = json.dumps({
+    "posts": [
+        {
+            "id": "post1",
+            "author": "alice_chen",
+            "content": "I don't understand Raft leader election.",
+            "type": "question",
+            "timestamp": "2024-01-15T10:00:00Z"
+        },
+        {
+            "id": "post2",
+            "author": "bob_smith",
+            "content": "Raft uses timeouts to detect leader failure.",
+            "type": "answer",
+            "timestamp": "2024-01-15T10:30:00Z"
+        }
+    ]
+}).encode()
+
+
+@pytest.fixture(scope="module")
+def ingestors():
+    """One instance of each ingestor, shared by every test in the module."""
+    return {
+        "slides": SlidesIngestor(),
+        "paper": PaperIngestor(),
+        "transcript": TranscriptIngestor(),
+        "assignment": AssignmentIngestor(),
+        "discussion": DiscussionIngestor(),
+        "code": CodeIngestor(),
+        "notes": NotesIngestor(),
+    }
+
 
-def test_slides_ingestor_pdf(tmp_path):
+def test_slides_ingestor_pdf(tmp_path, ingestors):
     """Test PDF slide ingestion."""
     # Create minimal PDF (in real test, use actual PDF)
     pdf_path = tmp_path / "test_slides.pdf"
     pdf_path.touch()
     
-    ingestor = SlidesIngestor()
+    ingestor = ingestors["slides"]
     
     # Test can_ingest
     assert ingestor.can_ingest(pdf_path)
@@ -31,18 +93,12 @@ def test_slides_ingestor_pdf(tmp_path):
     # This test verifies the structure works
 
 
-def test_transcript_ingestor(tmp_path):
+def test_transcript_ingestor(fs, ingestors):
     """Test transcript ingestion with filler removal."""
-    transcript_path = tmp_path / "lecture1_transcript.txt"
-    transcript_path.write_text(
-        "Lecture 1: Introduction\n"
-        "Um, today we'll cover, uh, MapReduce.\n"
-        "You know, it's a distributed system protocol.\n"
-        "Like, it's really important."
-    )
+    transcript_path = Path("/fake/lecture1_transcript.txt")
+    fs.create_file(transcript_path, contents=_TRANSCRIPT_BYTES)
     
-    ingestor = TranscriptIngestor()
-    chunks = ingestor.ingest(transcript_path)
+    chunks = ingestors["transcript"].ingest(transcript_path)
     
     assert len(chunks) > 0
     assert chunks[0].metadata["source_type"] == "lecture_transcript"
@@ -53,24 +109,12 @@ def test_transcript_ingestor(tmp_path):
     # Note: Filler removal is approximate
 
 
-def test_assignment_ingestor_markdown(tmp_path):
+def test_assignment_ingestor_markdown(fs, ingestors):
     """Test Markdown assignment ingestion."""
-    assignment_path = tmp_path / "assignment1.md"
-    assignment_path.write_text(
-        "# Assignment 1: MapReduce\n\n"
-        "## Description\n"
-        "Implement a basic MapReduce system.\n\n"
-        "## Requirements\n"
-        "- Implement Map function\n"
-        "- Implement Reduce function\n"
-        "- Handle failures\n\n"
-        "## Grading\n"
-        "- Correctness: 50%\n"
-        "- Code quality: 30%"
-    )
-    
-    ingestor = AssignmentIngestor()
-    chunks = ingestor.ingest(assignment_path)
+    assignment_path = Path("/fake/assignment1.md")
+    fs.create_file(assignment_path, contents=_ASSIGNMENT_BYTES)
+    
+    chunks = ingestors["assignment"].ingest(assignment_path)
     
     assert len(chunks) > 0
     
@@ -80,31 +124,12 @@ def test_assignment_ingestor_markdown(tmp_path):
     assert "requirements" in sections or "grading" in sections
 
 
-def test_discussion_ingestor_anonymization(tmp_path):
+def test_discussion_ingestor_anonymization(fs, ingestors):
     """Test discussion post ingestion with anonymization."""
-    discussion_path = tmp_path / "discussion.json"
-    discussion_data = {
-        "posts": [
-            {
-                "id": "post1",
-                "author": "alice_chen",
-                "content": "I don't understand Raft leader election.",
-                "type": "question",
-                "timestamp": "2024-01-15T10:00:00Z"
-            },
-            {
-                "id": "post2",
-                "author": "bob_smith",
-                "content": "Raft uses timeouts to detect leader failure.",
-                "type": "answer",
-                "timestamp": "2024-01-15T10:30:00Z"
-            }
-        ]
-    }
-    discussion_path.write_text(json.dumps(discussion_data))
+    discussion_path = Path("/fake/discussion.json")
+    fs.create_file(discussion_path, contents=_DISCUSSION_BYTES)
     
-    ingestor = DiscussionIngestor()
-    chunks = ingestor.ingest(discussion_path)
+    chunks = ingestors["discussion"].ingest(discussion_path)
     
     assert len(chunks) == 2
     
@@ -118,71 +143,52 @@ def test_discussion_ingestor_anonymization(tmp_path):
     assert "question" in post_types or "confusion" in post_types
 
 
-def test_code_ingestor_go(tmp_path):
-    """Test Go code ingestion."""
-    code_path = tmp_path / "raft.go"
-    code_path.write_text(
-        "package main\n\n"
-        "// RaftLeader implements leader election\n"
-        "func RaftLeader() {\n"
-        "    // Leader election logic\n"
-        "}\n\n"
-        "type RaftNode struct {\n"
-        "    id int\n"
-        "}\n"
-    )
-    
-    ingestor = CodeIngestor()
-    chunks = ingestor.ingest(code_path)
+@pytest.mark.parametrize("filename,content,expected_types", [
+    (
+        "raft.go",
+        b"package main\n\n"
+        b"// RaftLeader implements leader election\n"
+        b"func RaftLeader() {\n"
+        b"    // Leader election logic\n"
+        b"}\n\n"
+        b"type RaftNode struct {\n"
+        b"    id int\n"
+        b"}\n",
+        ("function", "struct"),
+    ),
+    (
+        "mapreduce.py",
+        b'"""MapReduce implementation."""\n\n'
+        b"def map_function(data):\n"
+        b'    """Map data to key-value pairs."""\n'
+        b"    return []\n\n"
+        b"class MapReduce:\n"
+        b'    """Main MapReduce class."""\n'
+        b"    pass\n",
+        ("function",),
+    ),
+], ids=["go", "python"])
+def test_code_ingestor(fs, ingestors, filename, content, expected_types):
+    """Test Go and Python code ingestion."""
+    code_path = Path("/fake") / filename
+    fs.create_file(code_path, contents=content)
+    
+    chunks = ingestors["code"].ingest(code_path)
     
     assert len(chunks) > 0
     
-    # Verify function extracted
-    func_chunks = [c for c in chunks if c.metadata.get("element_type") == "function"]
-    assert len(func_chunks) > 0
-    
-    # Verify struct extracted
-    struct_chunks = [c for c in chunks if c.metadata.get("element_type") == "struct"]
-    assert len(struct_chunks) > 0
+    # Verify functions (and Go structs) extracted
+    for element_type in expected_types:
+        typed_chunks = [c for c in chunks if c.metadata.get("element_type") == element_type]
+        assert len(typed_chunks) > 0
 
 
-def test_code_ingestor_python(tmp_path):
-    """Test Python code ingestion."""
-    code_path = tmp_path / "mapreduce.py"
-    code_path.write_text(
-        '"""MapReduce implementation."""\n\n'
-        "def map_function(data):\n"
-        '    """Map data to key-value pairs."""\n'
-        "    return []\n\n"
-        "class MapReduce:\n"
-        '    """Main MapReduce class."""\n'
-        "    pass\n"
-    )
-    
-    ingestor = CodeIngestor()
-    chunks = ingestor.ingest(code_path)
-    
-    assert len(chunks) > 0
-    
-    # Verify function extracted
-    func_chunks = [c for c in chunks if c.metadata.get("element_type") == "function"]
-    assert len(func_chunks) > 0
-
-
-def test_notes_ingestor_markdown(tmp_path):
+def test_notes_ingestor_markdown(fs, ingestors):
     """Test notes ingestion with heading chunking."""
-    notes_path = tmp_path / "week5_raft.md"
-    notes_path.write_text(
-        "# Raft Protocol\n\n"
-        "Raft is a consensus algorithm.\n\n"
-        "## Leader Election\n\n"
-        "Leaders are elected via timeouts.\n\n"
-        "## Log Replication\n\n"
-        "Logs are replicated to followers.\n"
-    )
-    
-    ingestor = NotesIngestor()
-    chunks = ingestor.ingest(notes_path)
+    notes_path = Path("/fake/week5_raft.md")
+    fs.create_file(notes_path, contents=_NOTES_BYTES)
+    
+    chunks = ingestors["notes"].ingest(notes_path)
     
     assert len(chunks) >= 2  # At least main heading + one subheading
     
@@ -191,25 +197,24 @@ def test_notes_ingestor_markdown(tmp_path):
     assert "Raft Protocol" in headings or any("Raft" in h for h in headings)
 
 
-def test_content_hash_deterministic(tmp_path):
+def test_content_hash_deterministic(fs, ingestors):
     """Test that content hash is deterministic."""
-    transcript_path = tmp_path / "test.txt"
-    transcript_path.write_text("Test content")
+    transcript_path = Path("/fake/test.txt")
+    fs.create_file(transcript_path, contents=b"Test content")
     
-    ingestor = TranscriptIngestor()
+    ingestor = ingestors["transcript"]
     chunks1 = ingestor.ingest(transcript_path)
     chunks2 = ingestor.ingest(transcript_path)
     
     assert chunks1[0].content_hash == chunks2[0].content_hash
 
 
-def test_metadata_fields_populated(tmp_path):
+def test_metadata_fields_populated(fs, ingestors):
     """Test that all metadata fields are populated."""
-    assignment_path = tmp_path / "test.md"
-    assignment_path.write_text("# Test Assignment")
+    assignment_path = Path("/fake/test.md")
+    fs.create_file(assignment_path, contents=b"# Test Assignment")
     
-    ingestor = AssignmentIngestor()
-    chunks = ingestor.ingest(assignment_path)
+    chunks = ingestors["assignment"].ingest(assignment_path)
     
     assert len(chunks) > 0
     chunk = chunks[0]
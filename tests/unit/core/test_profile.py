@@ -9,30 +9,40 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from src.core.profile.generator import ProfileGenerator
 from src.core.profile.cache import ProfileCache
 
+# Graph record returned by the mocked Neo4j session
+_MOCK_DATA = {
+    "student_id": "test_student",
+    "understandings": [
+        {"concept_name": "Raft", "confidence": 0.8, "context_scope": "theoretical"}
+    ],
+    "gaps": [],
+    "misconceptions": []
+}
 
-@pytest.mark.asyncio
+
+@pytest.fixture(scope="module")
+def profile_cache():
+    """Shared ProfileCache; the L2 table is only initialised once per module."""
+    return ProfileCache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_l1_cache(profile_cache):
+    """Reset the in-memory tier between tests."""
+    yield
+    profile_cache.l1_cache.clear()
+
+
+@pytest.mark.integration
 async def test_profile_generated_from_graph(neo4j_driver):
     """Test that profile is generated from graph queries."""
     generator = ProfileGenerator()
     
     # Mock Neo4j response
     mock_record = MagicMock()
-    mock_record.__getitem__.side_effect = lambda key: {
-        "student_id": "test_student",
-        "understandings": [
-            {"concept_name": "Raft", "confidence": 0.8, "context_scope": "theoretical"}
-        ],
-        "gaps": [],
-        "misconceptions": []
-    }.get(key, [])
-    mock_record.get = lambda key, default=None: {
-        "student_id": "test_student",
-        "understandings": [
-            {"concept_name": "Raft", "confidence": 0.8, "context_scope": "theoretical"}
-        ],
-        "gaps": [],
-        "misconceptions": []
-    }.get(key, default)
+    # Missing keys (e.g. the topic lookup's "id") fall back to [] as before
+    mock_record.__getitem__.side_effect = lambda key: _MOCK_DATA.get(key, [])
+    mock_record.get = _MOCK_DATA.get
     
     with patch.object(generator.neo4j, 'session') as mock_session:
         mock_result = MagicMock()
@@ -45,10 +55,9 @@ async def test_profile_generated_from_graph(neo4j_driver):
         assert "confidence" in profile.lower() or "0.8" in profile
 
 
-@pytest.mark.asyncio
-async def test_cache_hit_prevents_graph_query():
+async def test_cache_hit_prevents_graph_query(profile_cache):
     """Test that cache hit prevents redundant graph queries."""
-    cache = ProfileCache()
+    cache = profile_cache
     generator = ProfileGenerator()
     
     # Mock generator to track calls
@@ -60,21 +69,21 @@ async def test_cache_hit_prevents_graph_query():
         return "# Test Profile"
     
     generator.generate = mock_generate
-    cache.generator = generator
-    
-    # First call - should generate
-    profile1 = await cache.get_profile("student1", "Raft", "study")
-    assert call_count == 1
     
-    # Second call - should hit cache
-    profile2 = await cache.get_profile("student1", "Raft", "study")
-    assert call_count == 1  # No additional call
-    assert profile1 == profile2
+    with patch.object(cache, 'generator', generator):
+        # First call - should generate
+        profile1 = await cache.get_profile("student1", "Raft", "study")
+        assert call_count == 1
+        
+        # Second call - should hit cache
+        profile2 = await cache.get_profile("student1", "Raft", "study")
+        assert call_count == 1  # No additional call
+        assert profile1 == profile2
 
 
-def test_cache_invalidation():
+def test_cache_invalidation(profile_cache):
     """Test that cache invalidation clears student profiles."""
-    cache = ProfileCache()
+    cache = profile_cache
     
     # Populate cache
     cache.l1_cache["student1:Raft:study"] = ("# Profile", time.time())
@@ -86,7 +95,6 @@ def test_cache_invalidation():
     assert "student1:Raft:study" not in cache.l1_cache
 
 
-@pytest.mark.asyncio
 async def test_profile_varies_by_session_type():
     """Test that different session types produce different profiles."""
     generator = ProfileGenerator()
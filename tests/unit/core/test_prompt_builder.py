@@ -9,16 +9,23 @@ from unittest.mock import AsyncMock, patch
 from src.core.prompt.builder import PromptBuilder
 
 
-def test_bootstrap_files_loaded(tmp_path):
-    """Test that bootstrap files are loaded."""
-    bootstrap_dir = tmp_path / "bootstrap"
-    bootstrap_dir.mkdir()
-    
-    # Create test bootstrap file
+@pytest.fixture(scope="module")
+def builder(tmp_path_factory):
+    """Shared PromptBuilder over a minimal bootstrap directory."""
+    bootstrap_dir = tmp_path_factory.mktemp("bs")
     (bootstrap_dir / "TEACHING_PROTOCOL.md").write_text("# Teaching Protocol\n\nContent here")
-    
-    builder = PromptBuilder({"bootstrap_dir": str(bootstrap_dir)})
-    
+    return PromptBuilder({"bootstrap_dir": str(bootstrap_dir)})
+
+
+@pytest.fixture(autouse=True)
+def _clear_profile_cache(builder):
+    """Drop cached profiles so tests don't see each other's entries."""
+    yield
+    builder.profile_cache.l1_cache.clear()
+
+
+def test_bootstrap_files_loaded(builder):
+    """Test that bootstrap files are loaded."""
     content = builder._load_bootstrap_files("general")
     
     assert "Teaching Protocol" in content
@@ -47,16 +54,12 @@ def test_bootstrap_truncation_preserves_head_tail(tmp_path):
     assert "[... content truncated ...]" in content
 
 
-@pytest.mark.asyncio
-async def test_profile_injected_into_prompt():
+async def test_profile_injected_into_prompt(builder):
     """Test that student profile is injected into system prompt."""
-    builder = PromptBuilder()
-    
     # Mock profile cache
     mock_profile = "# Student Profile\n## Concepts: Raft"
-    builder.profile_cache.get_profile = AsyncMock(return_value=mock_profile)
-    
-    messages = await builder.build("student1", "Raft", "study")
+    with patch.object(builder.profile_cache, 'get_profile', new_callable=AsyncMock, return_value=mock_profile):
+        messages = await builder.build("student1", "Raft", "study")
     
     assert len(messages) == 1
     assert "system" == messages[0]["role"]
@@ -64,11 +67,8 @@ async def test_profile_injected_into_prompt():
     assert "Raft" in messages[0]["content"]
 
 
-@pytest.mark.asyncio
-async def test_token_budget_enforced():
+async def test_token_budget_enforced(builder):
     """Test that system prompt respects token budget."""
-    builder = PromptBuilder()
-    
     # Create very long content
     long_content = "X" * 50000  # Way over 3000 token budget
     
@@ -9,24 +9,30 @@ from src.core.indexing.resolver import EntityResolver, ResolvedEntity
 from src.core.indexing.extractor import Entity
 
 
+@pytest.fixture(scope="module")
+def resolver():
+    """Resolver shared by the module; tests swap its clients via monkeypatch."""
+    return EntityResolver()
+
+
+def _unit(axis, dim=1536):
+    """Unit vector along one axis, as a normalized embedding."""
+    vector = [0.0] * dim
+    vector[axis] = 1.0
+    return vector
+
+
+async def _embed_distinct(texts):
+    """One orthogonal unit vector per text: nothing is similar."""
+    return [_unit(i) for i in range(len(texts))]
+
+
 @pytest.fixture
 def mock_embedding():
-    """Mock embedding client."""
+    """Mock embedding client returning normalized batches, like EmbeddingClient.embed."""
     mock = AsyncMock()
-    
-    # Mock cosine similarity
-    def cosine_sim(vec1, vec2):
-        # Simulate: "Raft" and "Raft consensus" are similar
-        if "raft" in str(vec1).lower() and "raft" in str(vec2).lower():
-            return 0.90
-        # "Raft" and "Paxos" are different
-        if "raft" in str(vec1).lower() and "paxos" in str(vec2).lower():
-            return 0.30
-        return 0.50
-    
-    mock.cosine_similarity = cosine_sim
-    mock.embed.return_value = [[0.1] * 1536]  # Dummy embedding
-    
+    mock.embedding_normalized = True
+    mock.embed = _embed_distinct
     return mock
 
 
@@ -39,55 +45,40 @@ def mock_llm():
     return mock
 
 
-@pytest.mark.asyncio
-async def test_exact_match_handles_case_and_whitespace(mock_embedding, mock_llm):
-    """Test that exact match handles case and whitespace variations."""
-    entities = [
-        Entity(name="Raft", type="PROTOCOL", description="Consensus algorithm"),
-        Entity(name="RAFT", type="PROTOCOL", description="Consensus protocol"),
-        Entity(name="  Raft  ", type="PROTOCOL", description="Distributed consensus"),
+async def _embed_raft_variants(texts):
+    """Same embedding for Raft variants, an orthogonal one for everything else."""
+    return [
+        _unit(0) if "raft" in text.lower() else _unit(i + 1)
+        for i, text in enumerate(texts)
     ]
-    
-    resolver = EntityResolver()
-    resolver.embedding_client = mock_embedding
-    resolver.llm = mock_llm
-    
-    resolved = await resolver.resolve(entities)
-    
-    # Should merge all three into one
+
+
+async def _embed_near_identical(texts):
+    """Nearly the same unit vector for every text, so tier 2 groups them all."""
+    vectors = []
+    for i in range(len(texts)):
+        vector = _unit(0)
+        vector[0] = 0.999
+        vector[i + 1] = (1 - 0.999 ** 2) ** 0.5
+        vectors.append(vector)
+    return vectors
+
+
+def _raft_paxos_reply(prompt):
+    """Raft and Paxos are different; anything else is the same entity."""
+    if "Raft" in prompt and "Paxos" in prompt:
+        return "NO - Raft and Paxos are different consensus protocols."
+    return "YES - These are the same."
+
+
+def _check_exact_match(resolved):
+    # Should merge all three into one; the canonical name is one variant verbatim
     assert len(resolved) == 1
-    assert resolved[0].canonical_name.lower() == "raft"
+    assert resolved[0].canonical_name.strip().lower() == "raft"
     assert len(resolved[0].descriptions) == 3
 
 
-@pytest.mark.asyncio
-async def test_embedding_tier_catches_similar_names(mock_embedding, mock_llm):
-    """Test that embedding similarity catches 'Raft consensus' ≈ 'Raft protocol'."""
-    # Mock embedding to return high similarity for Raft variants
-    async def mock_embed(texts):
-        # Return same embedding for Raft variants, different for Paxos
-        embeddings = []
-        for text in texts:
-            if "raft" in text.lower():
-                embeddings.append([0.9] * 1536)
-            else:
-                embeddings.append([0.1] * 1536)
-        return embeddings if len(texts) > 1 else embeddings[0]
-    
-    mock_embedding.embed = mock_embed
-    
-    entities = [
-        Entity(name="Raft", type="PROTOCOL", description="Consensus"),
-        Entity(name="Raft consensus algorithm", type="PROTOCOL", description="Consensus protocol"),
-        Entity(name="Paxos", type="PROTOCOL", description="Alternative consensus"),
-    ]
-    
-    resolver = EntityResolver()
-    resolver.embedding_client = mock_embedding
-    resolver.llm = mock_llm
-    
-    resolved = await resolver.resolve(entities)
-    
+def _check_embedding_tier(resolved):
     # Raft variants should merge, Paxos should remain separate
     raft_entities = [r for r in resolved if "raft" in r.canonical_name.lower()]
     paxos_entities = [r for r in resolved if "paxos" in r.canonical_name.lower()]
@@ -97,52 +88,16 @@ async def test_embedding_tier_catches_similar_names(mock_embedding, mock_llm):
     assert raft_entities[0].canonical_name != paxos_entities[0].canonical_name
 
 
-@pytest.mark.asyncio
-async def test_llm_tier_resolves_brewer_cap_theorem(mock_embedding, mock_llm):
-    """Test that LLM tier resolves 'Brewer's theorem' ≈ 'CAP theorem'."""
-    # Mock LLM to say these are the same
-    mock_llm.get_completion.return_value = "YES - Brewer's theorem is the same as CAP theorem."
-    
-    entities = [
-        Entity(name="Brewer's theorem", type="THEOREM", description="CAP theorem"),
-        Entity(name="CAP theorem", type="THEOREM", description="Consistency, Availability, Partition tolerance"),
-        Entity(name="Brewer's CAP theorem", type="THEOREM", description="Distributed systems theorem"),
-    ]
-    
-    resolver = EntityResolver()
-    resolver.embedding_client = mock_embedding
-    resolver.llm = mock_llm
-    
-    resolved = await resolver.resolve(entities)
-    
+def _check_brewer_cap(resolved):
     # Should merge into one
     assert len(resolved) == 1
     # Canonical name should be one of the variants
     assert "cap" in resolved[0].canonical_name.lower() or "brewer" in resolved[0].canonical_name.lower()
+    # The other two names survive as aliases of the LLM-confirmed merge
+    assert len(resolved[0].aliases) == 2
 
 
-@pytest.mark.asyncio
-async def test_non_matches_preserved(mock_embedding, mock_llm):
-    """Test that non-matching entities remain separate."""
-    # Mock LLM to say Raft and Paxos are different
-    def llm_response(prompt):
-        if "Raft" in prompt and "Paxos" in prompt:
-            return "NO - Raft and Paxos are different consensus protocols."
-        return "YES - These are the same."
-    
-    mock_llm.get_completion.side_effect = lambda p: llm_response(p)
-    
-    entities = [
-        Entity(name="Raft", type="PROTOCOL", description="Consensus"),
-        Entity(name="Paxos", type="PROTOCOL", description="Consensus"),
-    ]
-    
-    resolver = EntityResolver()
-    resolver.embedding_client = mock_embedding
-    resolver.llm = mock_llm
-    
-    resolved = await resolver.resolve(entities)
-    
+def _check_non_matches(resolved):
     # Should remain separate
     assert len(resolved) == 2
     names = {r.canonical_name for r in resolved}
@@ -150,6 +105,70 @@ async def test_non_matches_preserved(mock_embedding, mock_llm):
     assert "Paxos" in names or any("paxos" in n.lower() for n in names)
 
 
+@pytest.mark.parametrize("entities,llm_reply,embed_fn,check", [
+    (
+        # Exact match handles case and whitespace variations
+        [
+            Entity(name="Raft", type="PROTOCOL", description="Consensus algorithm"),
+            Entity(name="RAFT", type="PROTOCOL", description="Consensus protocol"),
+            Entity(name="  Raft  ", type="PROTOCOL", description="Distributed consensus"),
+        ],
+        "YES - These refer to the same concept.",
+        None,
+        _check_exact_match,
+    ),
+    (
+        # Embedding similarity catches 'Raft consensus' ≈ 'Raft protocol'
+        [
+            Entity(name="Raft", type="PROTOCOL", description="Consensus"),
+            Entity(name="Raft consensus algorithm", type="PROTOCOL", description="Consensus protocol"),
+            Entity(name="Paxos", type="PROTOCOL", description="Alternative consensus"),
+        ],
+        "YES - These refer to the same concept.",
+        _embed_raft_variants,
+        _check_embedding_tier,
+    ),
+    (
+        # LLM tier resolves 'Brewer's theorem' ≈ 'CAP theorem'
+        [
+            Entity(name="Brewer's theorem", type="THEOREM", description="CAP theorem"),
+            Entity(name="CAP theorem", type="THEOREM", description="Consistency, Availability, Partition tolerance"),
+            Entity(name="Brewer's CAP theorem", type="THEOREM", description="Distributed systems theorem"),
+        ],
+        "YES - Brewer's theorem is the same as CAP theorem.",
+        _embed_near_identical,
+        _check_brewer_cap,
+    ),
+    (
+        # Non-matching entities remain separate
+        [
+            Entity(name="Raft", type="PROTOCOL", description="Consensus"),
+            Entity(name="Paxos", type="PROTOCOL", description="Consensus"),
+        ],
+        _raft_paxos_reply,
+        None,
+        _check_non_matches,
+    ),
+], ids=["exact_match", "embedding_tier", "llm_tier_brewer_cap", "non_matches_preserved"])
+async def test_resolve(
+    resolver, mock_embedding, mock_llm, monkeypatch, entities, llm_reply, embed_fn, check
+):
+    """Run the three-tier resolve flow for each scenario and check the groups."""
+    if callable(llm_reply):
+        mock_llm.get_completion.side_effect = llm_reply
+    else:
+        mock_llm.get_completion.return_value = llm_reply
+    if embed_fn is not None:
+        mock_embedding.embed = embed_fn
+    
+    monkeypatch.setattr(resolver, "embedding_client", mock_embedding)
+    monkeypatch.setattr(resolver, "llm", mock_llm)
+    
+    resolved = await resolver.resolve(entities)
+    
+    check(resolved)
+
+
 def test_merged_entities_track_source_chunks():
     """Test that merged entities track all source chunk references."""
     # This would be tested in integration, but verify structure
@@ -2,17 +2,14 @@
 Tests for memory flush engine.
 """
 
-import pytest
 from unittest.mock import AsyncMock, patch
 
 from src.memory.flush import MemoryFlushEngine
-from src.memory.store import SafeMemoryStore
 
 
-@pytest.mark.asyncio
-async def test_flush_extracts_structured_events():
+async def test_flush_extracts_structured_events(memory_store):
     """Test that flush produces structured learning events."""
-    store = SafeMemoryStore()
+    store = memory_store
     engine = MemoryFlushEngine(store)
     
     # Mock LLM response
@@ -37,7 +34,6 @@ async def test_flush_extracts_structured_events():
             "INSERT INTO students (id, anonymized_id, consent_granted) VALUES (?, ?, 1)",
             ("test_student", "anon_123")
         )
-        conn.commit()
     
     session = {
         "student_id": "test_student",
@@ -56,10 +52,9 @@ async def test_flush_extracts_structured_events():
     assert events[0].confidence == 0.8
 
 
-@pytest.mark.asyncio
-async def test_flush_llm_failure_doesnt_block():
+async def test_flush_llm_failure_doesnt_block(memory_store):
     """Test that LLM failure doesn't block compaction."""
-    store = SafeMemoryStore()
+    store = memory_store
     engine = MemoryFlushEngine(store)
     
     # Mock LLM failure
@@ -78,9 +73,9 @@ async def test_flush_llm_failure_doesnt_block():
     assert events == []
 
 
-def test_flush_threshold_check():
+def test_flush_threshold_check(memory_store):
     """Test that flush triggers at correct threshold."""
-    store = SafeMemoryStore()
+    store = memory_store
     engine = MemoryFlushEngine(store, {"flush_threshold": 1000})
     
     # Session below threshold
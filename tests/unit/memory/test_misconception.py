@@ -2,17 +2,14 @@
 Tests for misconception detection.
 """
 
-import pytest
 from unittest.mock import AsyncMock, patch
 
 from src.memory.misconception import MisconceptionDetector
-from src.memory.store import SafeMemoryStore
 
 
-@pytest.mark.asyncio
-async def test_holding_vs_identifying_misconception():
+async def test_holding_vs_identifying_misconception(memory_store):
     """Test that system distinguishes HOLDING vs IDENTIFYING."""
-    store = SafeMemoryStore()
+    store = memory_store
     detector = MisconceptionDetector(store)
     
     # Mock LLM response for student HOLDING misconception
@@ -47,10 +44,9 @@ async def test_holding_vs_identifying_misconception():
     assert result2["holds_known_misconception"] is False
 
 
-@pytest.mark.asyncio
-async def test_new_candidate_written_to_wal():
+async def test_new_candidate_written_to_wal(memory_store):
     """Test that new candidate misconceptions are written to WAL."""
-    store = SafeMemoryStore()
+    store = memory_store
     detector = MisconceptionDetector(store)
     
     # Mock new candidate
@@ -72,7 +68,6 @@ async def test_new_candidate_written_to_wal():
         assert mock_write.called
 
 
-@pytest.mark.asyncio
 async def test_frequency_tracking():
     """Test that misconception frequency increments across students."""
     # This would test that multiple independent student interactions
@@ -4,13 +4,31 @@ Tests for SafeMemoryStore: ACID, crash recovery, deduplication.
 
 import pytest
 import sqlite3
-import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from src.memory.store import SafeMemoryStore
+from src.memory.store import SafeMemoryStore, _content_hash
 from src.shared.exceptions import ConsentRequiredError
 
 
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    """File-backed WAL store, initialized once for the module."""
+    db_path = tmp_path_factory.mktemp("memory") / "test.db"
+    return SafeMemoryStore(db_path)
+
+
+@pytest.fixture
+def clean_store(store):
+    """Shared store with all rows removed before the test."""
+    with store._get_connection() as conn:
+        conn.executescript(
+            "DELETE FROM memories; DELETE FROM student_facts; DELETE FROM students;"
+        )
+    store._consent_cache.clear()
+    return store
+
+
 def test_wal_mode_enabled(tmp_path):
     """Test that WAL mode is enabled."""
     db_path = tmp_path / "test.db"
@@ -21,10 +39,9 @@ def test_wal_mode_enabled(tmp_path):
         assert result[0].upper() == "WAL"
 
 
-def test_concurrent_writes(tmp_path):
+def test_concurrent_writes(clean_store):
     """Test ACID compliance with concurrent writes."""
-    db_path = tmp_path / "test.db"
-    store = SafeMemoryStore(db_path)
+    store = clean_store
     
     # Grant consent
     student_id = "test_student"
@@ -35,23 +52,9 @@ def test_concurrent_writes(tmp_path):
         )
         conn.commit()
     
-    # Concurrent writes
-    errors = []
-    
-    def write_memory(i):
-        try:
-            store.write_memory(student_id, f"Memory content {i}")
-        except Exception as e:
-            errors.append(str(e))
-    
-    threads = [threading.Thread(target=write_memory, args=(i,)) for i in range(10)]
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
-    
-    # Should have no errors
-    assert len(errors) == 0
+    # Concurrent writes; any exception propagates when the results are consumed
+    with ThreadPoolExecutor(max_workers=10) as ex:
+        list(ex.map(lambda i: store.write_memory(student_id, f"Memory content {i}"), range(10)))
     
     # Verify all memories written
     with store._get_connection() as conn:
@@ -62,10 +65,9 @@ def test_concurrent_writes(tmp_path):
         assert count == 10
 
 
-def test_content_hash_deduplication(tmp_path):
+def test_content_hash_deduplication(clean_store):
     """Test that duplicate content is not stored twice."""
-    db_path = tmp_path / "test.db"
-    store = SafeMemoryStore(db_path)
+    store = clean_store
     
     student_id = "test_student"
     with store._get_connection() as conn:
@@ -85,8 +87,7 @@ def test_content_hash_deduplication(tmp_path):
     assert id1 == id2
     
     # Verify only one record in database
-    import hashlib
-    content_hash = hashlib.sha256(content.encode()).hexdigest()
+    content_hash = _content_hash(content.encode())
     with store._get_connection() as conn:
         count = conn.execute(
             "SELECT COUNT(*) FROM memories WHERE content_hash = ?",
@@ -95,17 +96,112 @@ def test_content_hash_deduplication(tmp_path):
         assert count == 1
 
 
-def test_consent_required_for_write(tmp_path):
-    """Test that writing without consent raises error."""
+def test_legacy_hashes_migrated_on_open(tmp_path):
+    """Test that bare-hex SHA-256 rows are prefixed once and still deduplicate."""
+    import hashlib
+    
+    db_path = tmp_path / "test.db"
+    store = SafeMemoryStore(db_path)
+    
+    content = "Stored before hashes were prefixed"
+    legacy_hash = hashlib.sha256(content.encode()).hexdigest()
+    with store._get_connection() as conn:
+        conn.execute(
+            "INSERT INTO students (id, anonymized_id, consent_granted) VALUES (?, ?, 1)",
+            ("legacy", "anon_legacy")
+        )
+        conn.execute(
+            "INSERT INTO memories (student_id, content, content_hash) VALUES (?, ?, ?)",
+            ("legacy", content, legacy_hash)
+        )
+        # A database written before the migration existed
+        conn.execute("PRAGMA user_version = 0")
+    
+    reopened = SafeMemoryStore(db_path)
+    reopened.write_memory("legacy", content)
+    
+    with reopened._get_connection() as conn:
+        rows = conn.execute("SELECT content_hash FROM memories").fetchall()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    assert [row["content_hash"] for row in rows] == [f"sha256:{legacy_hash}"]
+    assert version >= 1
+
+
+def test_sha256_rows_deduplicate_under_any_algorithm(tmp_path):
+    """Test that rows keep their own algorithm and still match on reopen."""
     db_path = tmp_path / "test.db"
     store = SafeMemoryStore(db_path)
     
+    content = "Written by a host without blake3"
+    sha256_hash = _content_hash(content.encode(), "sha256")
+    with store._get_connection() as conn:
+        conn.execute(
+            "INSERT INTO students (id, anonymized_id, consent_granted) VALUES (?, ?, 1)",
+            ("mixed", "anon_mixed")
+        )
+        conn.execute(
+            "INSERT INTO memories (student_id, content, content_hash) VALUES (?, ?, ?)",
+            ("mixed", content, sha256_hash)
+        )
+    
+    reopened = SafeMemoryStore(db_path)
+    reopened.write_memory("mixed", content)
+    
+    with reopened._get_connection() as conn:
+        rows = conn.execute("SELECT content_hash FROM memories").fetchall()
+    assert [row["content_hash"] for row in rows] == [sha256_hash]
+
+
+def test_consent_required_for_write(clean_store):
+    """Test that writing without consent raises error."""
+    store = clean_store
+    
     student_id = "no_consent"
     
     with pytest.raises(ConsentRequiredError):
         store.write_memory(student_id, "Some content")
 
 
+def test_revoke_consent_blocks_writes(clean_store):
+    """Test that a revoked student is not served from the consent cache."""
+    store = clean_store
+    
+    student_id = "revoked"
+    with store._get_connection() as conn:
+        conn.execute(
+            "INSERT INTO students (id, anonymized_id, consent_granted) VALUES (?, ?, 1)",
+            (student_id, "anon_revoked")
+        )
+    
+    store.write_memory(student_id, "Before revoke")
+    store.revoke_consent(student_id)
+    
+    with pytest.raises(ConsentRequiredError):
+        store.write_memory(student_id, "After revoke")
+
+
+def test_external_revocation_seen_after_ttl(clean_store, monkeypatch):
+    """Test that a revocation written by another process ends cached consent."""
+    store = clean_store
+    monkeypatch.setattr(store, "_consent_cache_ttl", 0.0)
+    
+    student_id = "revoked_elsewhere"
+    with store._get_connection() as conn:
+        conn.execute(
+            "INSERT INTO students (id, anonymized_id, consent_granted) VALUES (?, ?, 1)",
+            (student_id, "anon_elsewhere")
+        )
+    
+    store.write_memory(student_id, "Before revoke")
+    
+    # Revoke directly in the database, bypassing this instance
+    with store._get_connection() as conn:
+        conn.execute("UPDATE students SET consent_granted = 0 WHERE id = ?", (student_id,))
+    
+    with pytest.raises(ConsentRequiredError):
+        store.write_memory(student_id, "After revoke")
+
+
 def test_crash_recovery(tmp_path):
     """Test crash recovery on startup."""
     db_path = tmp_path / "test.db"
@@ -2,11 +2,9 @@
 Tests for async WAL → Graph worker.
 """
 
-import pytest
 from unittest.mock import AsyncMock, patch
 
 from src.memory.worker import GraphSyncWorker, CircuitBreaker
-from src.memory.store import SafeMemoryStore
 
 
 def test_circuit_breaker_opens_after_threshold():
@@ -25,9 +23,8 @@ def test_circuit_breaker_opens_after_threshold():
 
 def test_circuit_breaker_resets_after_timeout():
     """Test that circuit breaker resets after timeout."""
-    import time
-    
-    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=1)  # 1 second timeout
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=1, time_fn=lambda: now[0])  # 1 second timeout
     
     # Open it
     breaker.record_failure()
@@ -36,19 +33,17 @@ def test_circuit_breaker_resets_after_timeout():
     
     assert breaker.state == "OPEN"
     
-    # Wait for timeout
-    time.sleep(1.1)
+    # Advance the fake clock past the timeout
+    now[0] += 1.1
     
     # Should be half-open
     assert breaker.can_proceed()
     assert breaker.state == "HALF_OPEN"
 
 
-@pytest.mark.asyncio
-async def test_idempotent_writes():
+async def test_idempotent_writes(memory_store):
     """Test that processing same fact twice only writes once."""
-    store = SafeMemoryStore()
-    worker = GraphSyncWorker(store)
+    worker = GraphSyncWorker(memory_store)
     
     # Mock fact
     fact = {
@@ -72,11 +67,11 @@ async def test_idempotent_writes():
         assert True  # Structure test
 
 
-def test_parameterized_cypher_in_worker():
+def test_parameterized_cypher_in_worker(memory_store):
     """Test that worker uses parameterized Cypher (security check)."""
     # This would scan worker code for string interpolation
     # For now, verify structure
-    worker = GraphSyncWorker(SafeMemoryStore())
+    worker = GraphSyncWorker(memory_store)
     
     # Worker should use queries from graph.queries module
     # which are all parameterized
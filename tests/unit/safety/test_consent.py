@@ -6,26 +6,42 @@ import pytest
 
 from src.safety.consent import ConsentManager
 from src.memory.store import SafeMemoryStore
+from src.shared.exceptions import ConsentRequiredError, SecurityViolationError
 
+VALID_PHRASES = ["I CONSENT", "I AGREE", "YES I CONSENT"]
 
-def test_exact_consent_phrases_pass():
+# Substring matching would accept these; exact match must not
+INVALID_PHRASES = [
+    "I DO NOT CONSENT but I CONSENT",
+    "I CONSENT to everything",
+    "CONSENT",
+    "I agree to terms",
+    "YES",
+]
+
+
+@pytest.fixture(scope="module")
+def consent_mgr(tmp_path_factory):
+    """Store and manager shared by the module; tests use distinct student ids."""
+    store = SafeMemoryStore(tmp_path_factory.mktemp("consent") / "consent.db")
+    return store, ConsentManager(store)
+
+
+@pytest.mark.parametrize("phrase", VALID_PHRASES)
+def test_exact_consent_phrases_pass(consent_mgr, phrase):
     """Test that exact consent phrases are accepted."""
-    store = SafeMemoryStore()
-    manager = ConsentManager(store)
+    store, manager = consent_mgr
     
     session_token = "token123"
-    student_id = "test_student"
+    student_id = f"test_student_{phrase}"
     
-    # These should pass
-    for phrase in ["I CONSENT", "I AGREE", "YES I CONSENT"]:
-        result = manager.grant_consent(student_id, phrase, session_token)
-        assert result["success"] is True
+    result = manager.grant_consent(student_id, phrase, session_token)
+    assert result["success"] is True
 
 
-def test_case_insensitive_but_exact():
+def test_case_insensitive_but_exact(consent_mgr):
     """Test that case doesn't matter but exact phrase does."""
-    store = SafeMemoryStore()
-    manager = ConsentManager(store)
+    store, manager = consent_mgr
     
     session_token = "token123"
     student_id = "test_student2"
@@ -38,36 +54,26 @@ def test_case_insensitive_but_exact():
     assert result["success"] is True
 
 
-def test_substring_matching_rejected():
+@pytest.mark.parametrize("phrase", INVALID_PHRASES)
+def test_substring_matching_rejected(consent_mgr, phrase):
     """Test that substring matches are rejected."""
-    store = SafeMemoryStore()
-    manager = ConsentManager(store)
+    store, manager = consent_mgr
     
     session_token = "token123"
     student_id = "test_student3"
     
-    # These should FAIL (substring matching would pass, but we use exact match)
-    invalid_phrases = [
-        "I DO NOT CONSENT but I CONSENT",
-        "I CONSENT to everything",
-        "CONSENT",
-        "I agree to terms",
-        "YES",
-    ]
-    
-    for phrase in invalid_phrases:
-        with pytest.raises(Exception):  # Should raise ConsentRequiredError
-            manager.grant_consent(student_id, phrase, session_token)
+    with pytest.raises(ConsentRequiredError):
+        manager.grant_consent(student_id, phrase, session_token)
 
 
-def test_session_token_binding():
+def test_session_token_binding(consent_mgr):
     """Test that session tokens prevent replay attacks."""
-    store = SafeMemoryStore()
-    manager = ConsentManager(store)
+    store, manager = consent_mgr
     
     student_id = "test_student4"
     valid_token = "valid_token_123"
     invalid_token = "invalid_token_456"
+    manager.session_tokens.clear()
     
     # First grant with valid token
     result = manager.grant_consent(student_id, "I CONSENT", valid_token)
@@ -75,14 +81,13 @@ def test_session_token_binding():
     
     # Try to reuse token from different session (should fail)
     manager.session_tokens.clear()  # Simulate new session
-    with pytest.raises(Exception):  # Should raise SecurityViolationError
+    with pytest.raises(SecurityViolationError):
         manager.grant_consent(student_id, "I CONSENT", valid_token)
 
 
-def test_consent_required_check():
+def test_consent_required_check(consent_mgr):
     """Test that operations require consent."""
-    store = SafeMemoryStore()
-    manager = ConsentManager(store)
+    store, manager = consent_mgr
     
     student_id = "no_consent_student"
     
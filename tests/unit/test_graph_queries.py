@@ -4,171 +4,195 @@ This test MUST fail if any query uses string interpolation.
 """
 
 import re
+import ast
 import inspect
+import textwrap
+import itertools
+import pytest
 from pathlib import Path
 import sys
+from typing import Dict, Iterator, List, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.graph import queries
 
+# Patterns that indicate string interpolation, as one alternation so each
+# source is scanned once; match.lastgroup names the rule that fired
+_INTERP_RE = re.compile(r"""
+    (?P<f_string>f["'])         # f-string
+  | (?P<format_call>\.format\()  # .format() method
+  | (?P<percent>%[sd])          # % formatting
+  | (?P<dollar_brace>\$\{)      # ${variable} syntax
+""", re.VERBOSE)
 
-def test_no_string_interpolation_in_queries():
+
+def _method_spans(source: str) -> List[Tuple[int, int, str]]:
+    """(first line, last line, name) of each method defined directly in a class source."""
+    class_node = ast.parse(textwrap.dedent(source)).body[0]
+    return [
+        # Decorators (e.g. @staticmethod) belong to the method they wrap
+        (min([node.lineno] + [d.lineno for d in node.decorator_list]), node.end_lineno, node.name)
+        for node in class_node.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+
+
+def _method_at(spans: List[Tuple[int, int, str]], lineno: int) -> str:
+    """Name of the class-level method whose body contains lineno."""
+    for first, last, name in spans:
+        if first <= lineno <= last:
+            return name
+    return "<class body>"
+
+
+# Query classes under test
+_QUERY_CLASSES = (
+    queries.CourseQueries,
+    queries.StudentQueries,
+    queries.MisconceptionQueries,
+    queries.ProfileQueries,
+)
+
+# Dummy argument by annotation; anything else gets a string
+_DUMMY_BY_TYPE = {str: "test", int: 1, float: 1.0, bool: True}
+
+
+def _methods(cls):
+    """Public functions defined on cls itself, unwrapping staticmethods."""
+    return [
+        (name, member.__func__ if isinstance(member, staticmethod) else member)
+        for name, member in vars(cls).items()
+        if not name.startswith('_')
+        and (inspect.isfunction(member) or isinstance(member, staticmethod))
+    ]
+
+
+@pytest.fixture(scope="module")
+def query_results():
+    """Every public query factory called once with dummy params, keyed by (class, method)."""
+    results = {}
+    for query_class in _QUERY_CLASSES:
+        for name, method in _methods(query_class):
+            params = {
+                param_name: _DUMMY_BY_TYPE.get(param.annotation, "test")
+                for param_name, param in inspect.signature(method).parameters.items()
+            }
+            try:
+                results[(query_class.__name__, name)] = method(**params)
+            except Exception:
+                # Can't build this query from dummies, skip
+                continue
+    return results
+
+
+def _scan_source(query_class) -> Iterator[Dict[str, str]]:
+    """Yield a violation for each interpolation pattern in the class source."""
+    # Read the class source once rather than once per method
+    try:
+        source = inspect.getsource(query_class)
+    except OSError:
+        return
+    spans = _method_spans(source)
+    
+    for match in _INTERP_RE.finditer(source):
+        name = _method_at(spans, source.count("\n", 0, match.start()) + 1)
+        if name.startswith('_'):
+            continue
+        
+        # Get context around match
+        start = max(0, match.start() - 50)
+        end = min(len(source), match.end() + 50)
+        
+        yield {
+            "class": query_class.__name__,
+            "method": name,
+            "pattern": match.lastgroup,
+            "context": source[start:end]
+        }
+
+
+def _scan_query(class_name: str, name: str, result) -> Iterator[Dict[str, str]]:
+    """Yield violations found in the query string a factory returned."""
+    query_string = result.query if hasattr(result, 'query') else str(result)
+    
+    # Check query string for interpolation
+    match = _INTERP_RE.search(query_string)
+    if match:
+        yield {
+            "class": class_name,
+            "method": name,
+            "pattern": f"Found in query string: {match.lastgroup}",
+            "query": query_string[:200]
+        }
+    
+    # Verify query uses $param syntax
+    if '$' not in query_string and '{' in query_string:
+        # Might be using {param} instead of $param
+        yield {
+            "class": class_name,
+            "method": name,
+            "pattern": "Query uses {param} instead of $param",
+            "query": query_string[:200]
+        }
+
+
+def _format_violation(violation: Dict[str, str]) -> str:
+    """Render one violation for the failure message."""
+    msg = f"Class: {violation['class']}, Method: {violation['method']}\n"
+    msg += f"Pattern: {violation['pattern']}\n"
+    if 'context' in violation:
+        msg += f"Context: {violation['context']}\n"
+    if 'query' in violation:
+        msg += f"Query: {violation['query']}\n"
+    return msg
+
+
+def test_no_string_interpolation_in_queries(query_results, request):
     """
     Verify that NO Cypher query uses string interpolation.
     Checks for f-strings, .format(), or % formatting in query strings.
-    """
-    # Patterns that indicate string interpolation
-    interpolation_patterns = [
-        r'f["\']',  # f-string
-        r'\.format\(',  # .format() method
-        r'%[sd]',  # % formatting
-        r'\$\{',  # ${variable} syntax
-    ]
-    
-    # Get all query classes
-    query_classes = [
-        queries.CourseQueries,
-        queries.StudentQueries,
-        queries.MisconceptionQueries,
-        queries.ProfileQueries,
-    ]
     
+    Under --maxfail=1 the first violation fails the test immediately;
+    otherwise all violations are collected into one report.
+    """
+    fail_fast = request.config.getoption("maxfail") == 1
     violations = []
     
-    for query_class in query_classes:
-        # Get all static methods
-        for name, method in inspect.getmembers(query_class, predicate=inspect.isfunction):
-            if name.startswith('_'):
-                continue
-            
-            # Get source code
-            try:
-                source = inspect.getsource(method)
-            except OSError:
-                continue
-            
-            # Check for interpolation patterns
-            for pattern in interpolation_patterns:
-                matches = re.finditer(pattern, source)
-                for match in matches:
-                    # Get context around match
-                    start = max(0, match.start() - 50)
-                    end = min(len(source), match.end() + 50)
-                    context = source[start:end]
-                    
-                    violations.append({
-                        "class": query_class.__name__,
-                        "method": name,
-                        "pattern": pattern,
-                        "context": context
-                    })
-            
-            # Also check the actual query string returned
-            try:
-                # Try to call with dummy params to get query
-                if 'concept_id' in inspect.signature(method).parameters:
-                    result = method("test_concept_id")
-                elif 'student_id' in inspect.signature(method).parameters:
-                    result = method("test_student_id")
-                elif 'name' in inspect.signature(method).parameters:
-                    result = method("test_name")
-                else:
-                    # Try with empty params
-                    sig = inspect.signature(method)
-                    params = {name: "test" for name in sig.parameters.keys()}
-                    result = method(**params)
-                
-                query_string = result.query if hasattr(result, 'query') else str(result)
-                
-                # Check query string for interpolation
-                for pattern in interpolation_patterns:
-                    if re.search(pattern, query_string):
-                        violations.append({
-                            "class": query_class.__name__,
-                            "method": name,
-                            "pattern": f"Found in query string: {pattern}",
-                            "query": query_string[:200]
-                        })
-                
-                # Verify query uses $param syntax
-                if '$' not in query_string and '{' in query_string:
-                    # Might be using {param} instead of $param
-                    violations.append({
-                        "class": query_class.__name__,
-                        "method": name,
-                        "pattern": "Query uses {param} instead of $param",
-                        "query": query_string[:200]
-                    })
-            
-            except Exception as e:
-                # Can't test this method, skip
-                pass
+    scans = itertools.chain(
+        itertools.chain.from_iterable(_scan_source(cls) for cls in _QUERY_CLASSES),
+        itertools.chain.from_iterable(
+            _scan_query(class_name, name, result)
+            for (class_name, name), result in query_results.items()
+        ),
+    )
+    for violation in scans:
+        if fail_fast:
+            pytest.fail(_format_violation(violation), pytrace=False)
+        violations.append(violation)
     
     # Assert no violations
     if violations:
         error_msg = "String interpolation violations found in Cypher queries:\n\n"
-        for violation in violations:
-            error_msg += f"Class: {violation['class']}, Method: {violation['method']}\n"
-            error_msg += f"Pattern: {violation['pattern']}\n"
-            if 'context' in violation:
-                error_msg += f"Context: {violation['context']}\n"
-            if 'query' in violation:
-                error_msg += f"Query: {violation['query']}\n"
-            error_msg += "\n"
+        error_msg += "".join(_format_violation(v) + "\n" for v in violations)
         
         assert False, error_msg
 
 
-def test_all_queries_return_query_result():
+def test_all_queries_return_query_result(query_results):
     """Verify all query methods return QueryResult with query and params."""
-    query_classes = [
-        queries.CourseQueries,
-        queries.StudentQueries,
-        queries.MisconceptionQueries,
-        queries.ProfileQueries,
-    ]
-    
-    for query_class in query_classes:
-        for name, method in inspect.getmembers(query_class, predicate=inspect.isfunction):
-            if name.startswith('_'):
-                continue
-            
-            # Try to call with minimal params
-            try:
-                sig = inspect.signature(method)
-                # Create dummy params
-                params = {}
-                for param_name, param in sig.parameters.items():
-                    if param.annotation == str:
-                        params[param_name] = "test"
-                    elif param.annotation == int:
-                        params[param_name] = 1
-                    elif param.annotation == float:
-                        params[param_name] = 1.0
-                    elif param.annotation == bool:
-                        params[param_name] = True
-                    else:
-                        params[param_name] = "test"
-                
-                result = method(**params)
-                
-                # Verify result structure
-                assert hasattr(result, 'query'), f"{query_class.__name__}.{name} must return QueryResult with 'query'"
-                assert hasattr(result, 'params'), f"{query_class.__name__}.{name} must return QueryResult with 'params'"
-                assert isinstance(result.query, str), f"{query_class.__name__}.{name} query must be string"
-                assert isinstance(result.params, dict), f"{query_class.__name__}.{name} params must be dict"
-            
-            except Exception as e:
-                # Skip if we can't test
-                pass
-
-
-def test_parameterized_syntax_examples():
+    for (class_name, name), result in query_results.items():
+        assert hasattr(result, 'query'), f"{class_name}.{name} must return QueryResult with 'query'"
+        assert hasattr(result, 'params'), f"{class_name}.{name} must return QueryResult with 'params'"
+        assert isinstance(result.query, str), f"{class_name}.{name} query must be string"
+        assert isinstance(result.params, dict), f"{class_name}.{name} params must be dict"
+
+
+def test_parameterized_syntax_examples(query_results):
     """Test that example queries use $param syntax."""
     # Test CourseQueries.upsert_concept
-    result = queries.CourseQueries.upsert_concept("Raft", "Consensus protocol")
+    result = query_results[("CourseQueries", "upsert_concept")]
     
     assert "$concept_id" in result.query
     assert "$name" in result.query
@@ -178,9 +202,7 @@ def test_parameterized_syntax_examples():
     assert "description" in result.params
     
     # Test StudentQueries.create_understanding_relationship
-    result = queries.StudentQueries.create_understanding_relationship(
-        "student_123", "concept_456", 0.8, "theoretical", "socratic_dialogue"
-    )
+    result = query_results[("StudentQueries", "create_understanding_relationship")]
     
     assert "$student_id" in result.query
     assert "$concept_id" in result.query
@@ -3,18 +3,36 @@ Tests for session management.
 """
 
 import pytest
-import json
-from pathlib import Path
-import tempfile
+import sqlite3
+from contextlib import contextmanager
 
 from src.session.manager import SessionManager
 
 
-def test_session_isolation(tmp_path):
-    """Test that two students don't share sessions."""
-    db_path = tmp_path / "sessions.db"
-    manager = SessionManager(db_path)
+class InMemorySessionManager(SessionManager):
+    """SessionManager on one private in-memory connection instead of a file."""
+    
+    def __init__(self, tmp_path):
+        self._conn = sqlite3.connect(":memory:")
+        self._conn.row_factory = sqlite3.Row
+        # The file path is never opened
+        super().__init__(tmp_path / "sessions.sqlite")
     
+    @contextmanager
+    def _get_connection(self):
+        yield self._conn
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Session manager over a private in-memory database."""
+    mgr = InMemorySessionManager(tmp_path)
+    yield mgr
+    mgr._conn.close()
+
+
+def test_session_isolation(manager):
+    """Test that two students don't share sessions."""
     # Create sessions for two students
     session1 = manager.get_or_create("student1", {"course": "cs6650", "context": "assignment-1"})
     session2 = manager.get_or_create("student2", {"course": "cs6650", "context": "assignment-1"})
@@ -25,11 +43,8 @@ def test_session_isolation(tmp_path):
     assert session2["student_id"] == "student2"
 
 
-def test_idle_timeout(tmp_path):
+def test_idle_timeout(manager):
     """Test that idle sessions expire."""
-    db_path = tmp_path / "sessions.db"
-    manager = SessionManager(db_path)
-    
     # Create session
     session = manager.get_or_create("student1", {"course": "cs6650", "context": "interview"})
     session_key = session["session_key"]
@@ -41,18 +56,17 @@ def test_idle_timeout(tmp_path):
     assert timeout == 30
 
 
-def test_message_ordering(tmp_path):
+def test_message_ordering(manager):
     """Test that messages are stored in order."""
-    db_path = tmp_path / "sessions.db"
-    manager = SessionManager(db_path)
-    
     session = manager.get_or_create("student1", {"course": "cs6650", "context": "general"})
     session_key = session["session_key"]
     
-    # Add messages
-    manager.add_message(session_key, "student", "Message 1")
-    manager.add_message(session_key, "assistant", "Response 1")
-    manager.add_message(session_key, "student", "Message 2")
+    # Add messages in one transaction
+    manager.add_messages(session_key, [
+        ("student", "Message 1"),
+        ("assistant", "Response 1"),
+        ("student", "Message 2"),
+    ])
     
     # Retrieve messages
     messages = manager.get_messages(session_key)